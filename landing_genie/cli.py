@@ -2,37 +2,231 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib
+import json
+import logging
 import os
+import sys
+import time
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
 
 import typer
 
 from .config import Config
-from .gemini_runner import (
-    generate_site,
-    refine_site,
-    suggest_follow_up_questions,
-    suggest_image_follow_up_questions,
-)
-from .image_generator import (
-    ensure_placeholder_assets,
-    generate_image_prompts_for_site,
-    generate_images_for_site,
-)
-from .preview import serve_local
-from .cloudflare_api import deploy_contact_form_worker, deploy_to_pages, ensure_custom_domain
-from .site_paths import normalize_slug
+from .site_paths import cache_dir, normalize_slug
+
+if TYPE_CHECKING:
+    from .cloudflare_api import deploy_contact_form_worker, deploy_to_pages, ensure_custom_domain
+    from .gemini_runner import (
+        MAX_FOLLOW_UP_QUESTIONS,
+        MAX_IMAGE_FOLLOW_UP_QUESTIONS,
+        generate_site,
+        refine_site,
+        suggest_all_follow_up_questions,
+        suggest_follow_up_questions,
+        suggest_image_follow_up_questions,
+    )
+    from .image_generator import (
+        ensure_placeholder_assets,
+        generate_image_prompts_for_site,
+        generate_images_for_site,
+    )
+    from .preview import reload_previews, serve_local
+
+APP_HELP = "landing-genie - generate and deploy AI landing pages"
+
+# Command helpers are imported on first use so `--help`, `init`, and `list` do not pay
+# for importing requests and the Gemini/preview modules.
+_LAZY_IMPORTS: dict[str, str] = {
+    "deploy_contact_form_worker": ".cloudflare_api",
+    "deploy_to_pages": ".cloudflare_api",
+    "ensure_custom_domain": ".cloudflare_api",
+    "MAX_FOLLOW_UP_QUESTIONS": ".gemini_runner",
+    "MAX_IMAGE_FOLLOW_UP_QUESTIONS": ".gemini_runner",
+    "generate_site": ".gemini_runner",
+    "refine_site": ".gemini_runner",
+    "suggest_all_follow_up_questions": ".gemini_runner",
+    "suggest_follow_up_questions": ".gemini_runner",
+    "suggest_image_follow_up_questions": ".gemini_runner",
+    "ensure_placeholder_assets": ".image_generator",
+    "generate_image_prompts_for_site": ".image_generator",
+    "generate_images_for_site": ".image_generator",
+    "reload_previews": ".preview",
+    "serve_local": ".preview",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported command helpers as module attributes."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _load_lazy_imports(*names: str) -> None:
+    """
+    Bind lazily imported helpers into module globals before a command uses them.
 
-app = typer.Typer(help="landing-genie - generate and deploy AI landing pages")
+    Names already bound (e.g. by an earlier command or a test monkeypatch) are kept.
+    """
+    for name in names:
+        if name not in globals():
+            __getattr__(name)
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     """Return the repository root path."""
     return Path(__file__).resolve().parents[1]
 
 
+GEMINI_CACHE_TTL_ENV_VAR = "LANDING_GENIE_GEMINI_CACHE_TTL_SECONDS"
+DEFAULT_GEMINI_CACHE_TTL_SECONDS = 24 * 60 * 60
+FOLLOW_UP_TEMPLATE_NAMES = (
+    "follow_up_questions_prompt.md",
+    "image_follow_up_questions_prompt.md",
+    "combined_follow_up_questions_prompt.md",
+)
+
+
+def _gemini_cache_ttl() -> int:
+    """Resolve the follow-up cache TTL in seconds; 0 disables the cache."""
+    raw = os.getenv(GEMINI_CACHE_TTL_ENV_VAR)
+    if raw is None or raw.strip() == "":
+        return DEFAULT_GEMINI_CACHE_TTL_SECONDS
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return DEFAULT_GEMINI_CACHE_TTL_SECONDS
+
+
+def _follow_up_cache_key(root: Path, product_prompt: str, config: Config) -> list[str]:
+    """
+    Return the cache key parts for follow-up questions.
+
+    Covers everything that shapes Gemini's answer: the prompt, the model, the question
+    limits, and a hash of the follow-up templates, so editing any of them misses the cache.
+    """
+    _load_lazy_imports("MAX_FOLLOW_UP_QUESTIONS", "MAX_IMAGE_FOLLOW_UP_QUESTIONS")
+    templates = hashlib.sha256()
+    for name in FOLLOW_UP_TEMPLATE_NAMES:
+        try:
+            content = (root / "prompts" / name).read_bytes()
+        except OSError:
+            content = b""
+        templates.update(hashlib.sha256(content).digest())
+    return [
+        product_prompt,
+        config.gemini_code_model,
+        str(MAX_FOLLOW_UP_QUESTIONS),
+        str(MAX_IMAGE_FOLLOW_UP_QUESTIONS),
+        templates.hexdigest(),
+    ]
+
+
+def _question_cache_path(root: Path, kind: str, key_parts: list[str]) -> Path:
+    """Return the cache file for a question kind keyed by a hash of key_parts."""
+    key = hashlib.sha256(json.dumps([kind, *key_parts]).encode("utf-8")).hexdigest()
+    return cache_dir(root) / "gemini-cache" / f"{key}.json"
+
+
+def _read_cached_questions(cache_path: Path, ttl: int) -> Optional[list[str]]:
+    """Return cached questions if the entry is fresh and well-formed, otherwise None."""
+    try:
+        if time.time() - cache_path.stat().st_mtime >= ttl:
+            return None
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if isinstance(cached, list) and cached and all(isinstance(q, str) for q in cached):
+        return cached
+    return None
+
+
+def _write_cached_questions(cache_path: Path, questions: list[str]) -> None:
+    """Persist non-empty questions to the cache."""
+    if not questions:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(questions), encoding="utf-8")
+    except OSError:
+        # Caching is best-effort; a read-only checkout should not break generation.
+        pass
+
+
+def _cached_questions(
+    root: Path,
+    kind: str,
+    key_parts: list[str],
+    fetch: Callable[[], list[str]],
+) -> list[str]:
+    """
+    Return follow-up questions from the on-disk cache, calling Gemini only on a miss.
+
+    Entries live under .landing-genie/gemini-cache/ keyed by a hash of kind + key_parts
+    (see _follow_up_cache_key). Empty results and unreadable entries are never served from cache.
+    """
+    ttl = _gemini_cache_ttl()
+    if ttl <= 0:
+        return fetch()
+
+    cache_path = _question_cache_path(root, kind, key_parts)
+    cached = _read_cached_questions(cache_path, ttl)
+    if cached is not None:
+        return cached
+
+    questions = fetch()
+    _write_cached_questions(cache_path, questions)
+    return questions
+
+
+def _cached_follow_up_pair(
+    root: Path,
+    key_parts: list[str],
+    fetch: Callable[[], tuple[list[str], list[str]]],
+) -> tuple[list[str], list[str]]:
+    """
+    Return (text, image) follow-up questions, using one combined Gemini call on a cache miss.
+
+    Shares cache entries with _cached_questions so combined and separate fetches reuse
+    each other's results.
+    """
+    ttl = _gemini_cache_ttl()
+    if ttl <= 0:
+        return fetch()
+
+    text_path = _question_cache_path(root, "follow-up", key_parts)
+    image_path = _question_cache_path(root, "image-follow-up", key_parts)
+    text_cached = _read_cached_questions(text_path, ttl)
+    image_cached = _read_cached_questions(image_path, ttl)
+    if text_cached is not None and image_cached is not None:
+        return text_cached, image_cached
+
+    text_questions, image_questions = fetch()
+    _write_cached_questions(text_path, text_questions)
+    _write_cached_questions(image_path, image_questions)
+    return text_questions, image_questions
+
+
+def _configure_logging() -> None:
+    """Route landing_genie log records to stdout as plain messages (once per process)."""
+    package_logger = logging.getLogger("landing_genie")
+    if package_logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+
+
 def _enable_readline() -> None:
     """
     Import readline when available so arrow keys work naturally in interactive prompts.
@@ -44,7 +238,6 @@ def _enable_readline() -> None:
         return
 
 
-@app.command()
 def init() -> None:
     """Bootstrap local environment and check config."""
     typer.echo("Initializing landing-genie...")
@@ -57,7 +250,6 @@ def init() -> None:
         raise typer.Exit(code=1)
 
 
-@app.command()
 def new(
     prompt: Optional[str] = typer.Option(None, "--prompt", "-p", help="Product description and target audience"),
     suggested_subdomain: Optional[str] = typer.Option(None, "--suggested-subdomain", "-s"),
@@ -70,6 +262,18 @@ def new(
 ) -> None:
     """Generate a new landing page with Gemini CLI."""
     _enable_readline()
+    _load_lazy_imports(
+        "generate_site",
+        "refine_site",
+        "suggest_all_follow_up_questions",
+        "suggest_follow_up_questions",
+        "suggest_image_follow_up_questions",
+        "ensure_placeholder_assets",
+        "generate_image_prompts_for_site",
+        "generate_images_for_site",
+        "reload_previews",
+        "serve_local",
+    )
     config = Config.load()
     root = _project_root()
 
@@ -103,9 +307,38 @@ def new(
         typer.echo("Skipping image follow-ups because text follow-ups were disabled.")
         ask_image_follow_ups = False
 
-    if ask_follow_ups:
+    # Built on first use so runs that skip follow-ups never read the follow-up templates.
+    @lru_cache(maxsize=1)
+    def _cache_key() -> list[str]:
+        """Return the follow-up cache key for this prompt and config."""
+        return _follow_up_cache_key(root, product_prompt, config)
+
+    fetched_together = False
+    if ask_follow_ups and ask_image_follow_ups:
+        # One Gemini call for both question sets; fall back to separate calls if it fails.
+        try:
+            questions, image_questions = _cached_follow_up_pair(
+                root,
+                _cache_key(),
+                lambda: suggest_all_follow_up_questions(
+                    product_prompt=product_prompt, project_root=root, config=config, debug=debug
+                ),
+            )
+            fetched_together = True
+        except Exception as exc:
+            if debug:
+                typer.echo(f"Combined follow-up request failed; asking separately. ({exc})")
+
+    if ask_follow_ups and not fetched_together:
         try:
-            questions = suggest_follow_up_questions(product_prompt=product_prompt, project_root=root, config=config, debug=debug)
+            questions = _cached_questions(
+                root,
+                "follow-up",
+                _cache_key(),
+                lambda: suggest_follow_up_questions(
+                    product_prompt=product_prompt, project_root=root, config=config, debug=debug
+                ),
+            )
         except Exception as exc:
             typer.echo(f"Could not fetch follow-up questions from Gemini; continuing without them. ({exc})")
 
@@ -123,10 +356,15 @@ def new(
         if answers:
             follow_up_context = "\n".join(f"- {q} Answer: {a}" for q, a in answers)
 
-    if ask_image_follow_ups:
+    if ask_image_follow_ups and not fetched_together:
         try:
-            image_questions = suggest_image_follow_up_questions(
-                product_prompt=product_prompt, project_root=root, config=config, debug=debug
+            image_questions = _cached_questions(
+                root,
+                "image-follow-up",
+                _cache_key(),
+                lambda: suggest_image_follow_up_questions(
+                    product_prompt=product_prompt, project_root=root, config=config, debug=debug
+                ),
             )
         except Exception as exc:
             typer.echo(f"Could not fetch image follow-up questions from Gemini; continuing without them. ({exc})")
@@ -230,15 +468,15 @@ def new(
                 typer.echo("Placeholder assets added:")
                 for path in placeholder_created:
                     typer.echo(f"- {path}")
+            # The running server is reused; open tabs reload once the refinement has finished.
             url = serve_local(slug=slug, project_root=root, config=config, debug=debug)
             typer.echo(f"Updated preview at: {url}")
-            if open_browser:
+            if not reload_previews(slug, root) and open_browser:
                 webbrowser.open(url)
         else:
             typer.echo("Please answer y, n, or f.")
 
 
-@app.command()
 def deploy(slug: str = typer.Argument(..., help="Slug under sites/ to deploy")) -> None:
     """Deploy an existing landing to Cloudflare Pages."""
     try:
@@ -247,15 +485,16 @@ def deploy(slug: str = typer.Argument(..., help="Slug under sites/ to deploy"))
         typer.echo(f"Invalid slug: {exc}")
         raise typer.Exit(code=1)
 
+    _load_lazy_imports("deploy_contact_form_worker", "deploy_to_pages", "ensure_custom_domain")
+    _configure_logging()
     config = Config.load()
     root = _project_root()
     deploy_contact_form_worker(project_root=root, config=config)
     project_name = deploy_to_pages(slug=slug, project_root=root, config=config)
-    fqdn = ensure_custom_domain(slug=slug, project_name=project_name, config=config)
+    fqdn = ensure_custom_domain(slug=slug, project_name=project_name, config=config, project_root=root)
     typer.echo(f"Live URL: https://{fqdn}")
 
 
-@app.command()
 def images(
     slug: str = typer.Argument(..., help="Slug under sites/ to generate images for"),
     prompt: Optional[str] = typer.Option(None, "--prompt", "-p", help="Product description used to guide the images"),
@@ -276,6 +515,7 @@ def images(
         raise typer.Exit(code=1)
 
     _enable_readline()
+    _load_lazy_imports("generate_images_for_site")
     product_prompt = prompt or typer.prompt("Enter a short product description to guide the images")
 
     try:
@@ -298,7 +538,6 @@ def images(
         typer.echo("No image placeholders found or images already existed; nothing to do.")
 
 
-@app.command(name="list")
 def list_sites() -> None:
     """List generated landing pages under sites/."""
     root = _project_root()
@@ -307,7 +546,9 @@ def list_sites() -> None:
         typer.echo("No sites directory yet. Run `landing-genie init`.")
         raise typer.Exit(code=0)
 
-    slugs = sorted(d.name for d in sites_dir.iterdir() if d.is_dir())
+    # scandir entries carry the file type from the directory read, avoiding a stat per slug.
+    with os.scandir(sites_dir) as entries:
+        slugs = sorted(entry.name for entry in entries if entry.is_dir())
     if not slugs:
         typer.echo("No generated landings yet.")
         return
@@ -317,5 +558,53 @@ def list_sites() -> None:
         typer.echo(f"- {slug}")
 
 
+_COMMANDS: dict[str, Callable[..., None]] = {
+    "init": init,
+    "new": new,
+    "deploy": deploy,
+    "images": images,
+    "list": list_sites,
+}
+
+
+def _build_app(command_names: Iterable[str]) -> typer.Typer:
+    """Build a Typer app that registers only the named commands."""
+    typer_app = typer.Typer(help=APP_HELP)
+
+    @typer_app.callback()
+    def _root() -> None:
+        """Force subcommand dispatch even when a single command is registered."""
+
+    for name in command_names:
+        typer_app.command(name=name)(_COMMANDS[name])
+    return typer_app
+
+
+def _sniff_subcommand(argv: list[str]) -> Optional[str]:
+    """
+    Return the subcommand named on the command line, if it is a known command.
+
+    Only the first non-flag token is considered; top-level flags such as --help
+    return None so the full command tree is registered.
+    """
+    for token in argv[1:]:
+        if token.startswith("-"):
+            return None
+        return token if token in _COMMANDS else None
+    return None
+
+
+app = _build_app(_COMMANDS)
+
+
+def main() -> None:
+    """Console entrypoint: register only the invoked subcommand before parsing argv."""
+    command_name = _sniff_subcommand(sys.argv)
+    if command_name is None:
+        app()
+        return
+    _build_app([command_name])()
+
+
 if __name__ == "__main__":
-    app()
+    main()
@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import os
+import re
 import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from typing import IO, Any, Dict, List, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import Config
-from .site_paths import normalize_site_dir
+from .http_utils import CappedRetry
+from .site_paths import cache_dir, normalize_site_dir
+
+logger = logging.getLogger(__name__)
 
 API_BASE = "https://api.cloudflare.com/client/v4"
 PRODUCTION_BRANCH = "main"
@@ -23,12 +36,45 @@ CONTACT_WORKER_ROUTE_SUFFIX = "/api/contact*"
 CONTACT_WORKER_EMAIL_BINDING_NAME = "EMAIL"
 LEAD_FROM_LOCAL_PART = "leads"
 CONTACT_WORKER_NAME_MAX_LENGTH = 63
-_ZONE_CACHE: dict[str, str] = {}
+PAGES_PROJECT_NAME_MAX_LENGTH = 60
+DOMAIN_CACHE_TTL_SECONDS = 60
+WRANGLER_OUTPUT_TAIL_LINES = 200
+ZONE_CACHE_FILE_NAME = "zone-cache.json"
+ZONE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DOMAIN_CACHE_FILE_NAME = "domain-cache.json"
+# Keyed on (API token, root domain): different tokens may see different zones.
+_ZONE_CACHE: dict[tuple[str, str], str] = {}
+_ZONE_CACHE_LOCK = threading.Lock()
+# Guards read-modify-write of the persisted domain listings; ensure_custom_domain's workers share it.
+_DOMAIN_CACHE_LOCK = threading.Lock()
+
+
+# One pooled session for all Cloudflare API calls so a deploy reuses the same
+# keep-alive TLS connection instead of handshaking per request.
+# Transient failures are retried with exponential backoff (no wait, then 0.5s, 1s, 2s);
+# a server Retry-After is honoured but capped at RETRY_AFTER_MAX_SECONDS.
+# POST is left out so a retried create can never double-submit.
+_RETRY = CappedRetry(
+    total=4,
+    backoff_factor=0.25,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_RETRY))
+# (connect, read): a lost packet costs seconds and a retry, not a one-minute stall.
+_TIMEOUT = (3.05, 20)
 
 
 class CloudflareAPIError(RuntimeError):
     """Raised when Cloudflare responds with an error or Wrangler fails."""
 
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
 
 def _headers(config: Config) -> Dict[str, str]:
     """Build authorization headers for Cloudflare API requests."""
@@ -46,9 +92,13 @@ def _request(method: str, path: str, config: Config, **kwargs: Any) -> Any:
     headers = kwargs.pop("headers", {})
     headers.update(_headers(config))
 
-    resp = requests.request(method, url, headers=headers, timeout=60, **kwargs)
     try:
-        data = resp.json()
+        resp = _SESSION.request(method, url, headers=headers, timeout=_TIMEOUT, **kwargs)
+    except requests.RequestException as exc:
+        raise CloudflareAPIError(f"Cloudflare API {method} {path} failed: {exc}") from exc
+    try:
+        # Decode straight from the body bytes; json detects UTF-8 itself.
+        data = json.loads(resp.content)
     except ValueError:
         raise CloudflareAPIError(
             f"Cloudflare API {method} {path} returned non-JSON response: "
@@ -57,7 +107,8 @@ def _request(method: str, path: str, config: Config, **kwargs: Any) -> Any:
 
     if not resp.ok or not data.get("success", True):
         raise CloudflareAPIError(
-            f"Cloudflare API {method} {path} failed: {resp.status_code} {data}"
+            f"Cloudflare API {method} {path} failed: {resp.status_code} {data}",
+            status_code=resp.status_code,
         )
 
     return data.get("result", data)
@@ -68,25 +119,22 @@ def _request(method: str, path: str, config: Config, **kwargs: Any) -> Any:
 # ---------------------------------------------------------------------------
 
 
+_SLUG_SEPARATORS = str.maketrans({" ": "-", "_": "-", "/": "-"})
+# \w matches exactly what str.isalnum() accepts, plus "_", which is dropped explicitly.
+_NOT_ALNUM_OR_HYPHEN = re.compile(r"[^\w-]|_")
+
+
+@lru_cache(maxsize=1024)
 def _sanitize_slug(slug: str) -> str:
     """Normalize a slug into a safe Cloudflare project segment."""
-    out: List[str] = []
-    for ch in slug.lower():
-        if ch.isalnum() or ch == "-":
-            out.append(ch)
-        elif ch in {" ", "_", "/"}:
-            out.append("-")
-    cleaned = "".join(out).strip("-")
+    cleaned = _NOT_ALNUM_OR_HYPHEN.sub("", slug.lower().translate(_SLUG_SEPARATORS)).strip("-")
     return cleaned or "site"
 
 
+@lru_cache(maxsize=1024)
 def _sanitize_domain_for_project(root_domain: str) -> str:
     """Normalize a root domain into a safe project name segment."""
-    out: List[str] = []
-    for ch in root_domain.lower():
-        if ch.isalnum() or ch == "-":
-            out.append(ch)
-    cleaned = "".join(out)
+    cleaned = _NOT_ALNUM_OR_HYPHEN.sub("", root_domain.lower())
     if not cleaned:
         raise CloudflareAPIError(
             "Root domain is empty after sanitizing; cannot form project name"
@@ -94,17 +142,36 @@ def _sanitize_domain_for_project(root_domain: str) -> str:
     return cleaned
 
 
+def _untruncated_project_name(slug: str, root_domain: str) -> str:
+    """Build the full Pages project name for a slug/domain before the length limit applies."""
+    return f"lp-{_sanitize_slug(slug)}-{_sanitize_domain_for_project(root_domain)}"
+
+
+@lru_cache(maxsize=1024)
 def _project_name(slug: str, root_domain: str) -> str:
     """Build a Cloudflare Pages project name for a slug/domain."""
-    slug_part = _sanitize_slug(slug)
-    domain_part = _sanitize_domain_for_project(root_domain)
-    name = f"lp-{slug_part}-{domain_part}"
-    # Cloudflare Pages project name limit is 60 chars
-    if len(name) > 60:
-        name = name[:60]
+    name = _untruncated_project_name(slug, root_domain)
+    # Cloudflare Pages project name limit is 60 chars. Truncate with a short hash of the
+    # full name so slugs sharing a long prefix still map to distinct projects.
+    if len(name) > PAGES_PROJECT_NAME_MAX_LENGTH:
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=4).hexdigest()
+        prefix = name[: PAGES_PROJECT_NAME_MAX_LENGTH - len(digest) - 1].rstrip("-")
+        name = f"{prefix}-{digest}"
     return name
 
 
+def _legacy_project_name(slug: str, root_domain: str) -> str | None:
+    """
+    Return the name older releases used for an overlong project (a plain cut), or None.
+
+    Short names never changed, so only names over the limit have a legacy form.
+    """
+    name = _untruncated_project_name(slug, root_domain)
+    if len(name) <= PAGES_PROJECT_NAME_MAX_LENGTH:
+        return None
+    return name[:PAGES_PROJECT_NAME_MAX_LENGTH]
+
+
 def _contact_worker_name(root_domain: str) -> str:
     """
     Build a deterministic Worker name for the contact form handler.
@@ -145,7 +212,10 @@ def _get_pages_project(project_name: str, config: Config) -> dict[str, Any] | No
     """
     path = f"/accounts/{config.cf_account_id}/pages/projects/{project_name}"
     url = f"{API_BASE}{path}"
-    resp = requests.get(url, headers=_headers(config), timeout=60)
+    try:
+        resp = _SESSION.get(url, headers=_headers(config), timeout=_TIMEOUT)
+    except requests.RequestException as exc:
+        raise CloudflareAPIError(f"Cloudflare API GET {path} failed: {exc}") from exc
     if resp.status_code == 404:
         return None
     try:
@@ -162,6 +232,23 @@ def _get_pages_project(project_name: str, config: Config) -> dict[str, Any] | No
     return data.get("result", data)
 
 
+def _resolve_pages_project_name(slug: str, config: Config) -> str:
+    """
+    Return the Pages project a slug deploys to.
+
+    Sites first deployed with a cut-off overlong name keep using that project, since it
+    already owns their custom domain; everything else uses the hashed name.
+    """
+    project_name = _project_name(slug, config.root_domain)
+    legacy_name = _legacy_project_name(slug, config.root_domain)
+    if legacy_name is None or _get_pages_project(project_name, config):
+        return project_name
+    if _get_pages_project(legacy_name, config):
+        logger.info("Reusing existing Pages project %s for %s", legacy_name, slug)
+        return legacy_name
+    return project_name
+
+
 def _ensure_pages_project(project_name: str, config: Config) -> None:
     """
     Create the Pages project if it does not already exist.
@@ -179,6 +266,57 @@ def _ensure_pages_project(project_name: str, config: Config) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _wrangler_env(config: Config) -> Dict[str, str] | None:
+    """
+    Return the environment for a Wrangler run, or None to inherit os.environ as is.
+
+    Config usually comes from the same environment, so the credentials already
+    match and the process environment need not be copied for every spawn.
+    """
+    overrides = {
+        "CLOUDFLARE_ACCOUNT_ID": config.cf_account_id,
+        "CLOUDFLARE_API_TOKEN": config.cf_api_token,
+    }
+    if all(os.environ.get(key) == value for key, value in overrides.items()):
+        return None
+    return os.environ | overrides
+
+
+def _run_wrangler(
+    cmd: List[str],
+    *,
+    env: Dict[str, str] | None,
+    cwd: str | None = None,
+    echo: bool = True,
+) -> tuple[int, str]:
+    """
+    Run a Wrangler command, streaming its combined output line by line.
+
+    Lines are logged as they arrive when echo is True; only the last
+    WRANGLER_OUTPUT_TAIL_LINES are kept in memory for error reporting.
+    Returns (exit code, output tail).
+    """
+    tail: deque[str] = deque(maxlen=WRANGLER_OUTPUT_TAIL_LINES)
+    # Command is fully constructed from trusted inputs (slug/domain are sanitized).
+    with subprocess.Popen(  # nosec B603
+        cmd,
+        env=env,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        # stdout=PIPE always yields a stream; the cast only narrows the Optional type.
+        for line in cast(IO[str], proc.stdout):
+            line = line.rstrip("\n")
+            tail.append(line)
+            if echo:
+                logger.info("%s", line)
+        returncode = proc.wait()
+    return returncode, "\n".join(tail)
+
+
 def deploy_to_pages(slug: str, project_root: Path, config: Config) -> str:
     """
     Deploy sites/<slug>/ to Cloudflare Pages using Wrangler.
@@ -195,11 +333,9 @@ def deploy_to_pages(slug: str, project_root: Path, config: Config) -> str:
     if not site_dir.is_dir():
         raise CloudflareAPIError(f"Site directory does not exist: {site_dir}")
 
-    project_name = _project_name(slug, config.root_domain)
+    project_name = _resolve_pages_project_name(slug, config)
 
-    env = os.environ.copy()
-    env["CLOUDFLARE_ACCOUNT_ID"] = config.cf_account_id
-    env["CLOUDFLARE_API_TOKEN"] = config.cf_api_token
+    env = _wrangler_env(config)
 
     # Wrangler prompts to create a project when it does not exist; make that
     # non-interactive by creating it via the API first.
@@ -218,23 +354,13 @@ def deploy_to_pages(slug: str, project_root: Path, config: Config) -> str:
         PRODUCTION_BRANCH,
     ]
 
-    # Command is fully constructed from trusted inputs (slug/domain are sanitized).
-    proc = subprocess.run(  # nosec B603
-        cmd,
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-
-    if proc.returncode != 0:
+    # Upload progress is streamed to the log instead of buffered until exit.
+    returncode, output = _run_wrangler(cmd, env=env)
+    if returncode != 0:
         raise CloudflareAPIError(
-            "Wrangler deploy failed "
-            f"(exit {proc.returncode}).\n\nSTDOUT:\n{proc.stdout}\n\nSTDERR:\n{proc.stderr}"
+            f"Wrangler deploy failed (exit {returncode}).\n\nOUTPUT:\n{output}"
         )
 
-    # Optional: show Wrangler output for debugging
-    print(proc.stdout.strip())
-
     return project_name
 
 
@@ -331,9 +457,7 @@ def deploy_contact_form_worker(
 
     config_path.write_text(config_text, encoding="utf-8")
 
-    env = os.environ.copy()
-    env["CLOUDFLARE_ACCOUNT_ID"] = config.cf_account_id
-    env["CLOUDFLARE_API_TOKEN"] = config.cf_api_token
+    env = _wrangler_env(config)
 
     cmd = [
         "npx",
@@ -343,23 +467,13 @@ def deploy_contact_form_worker(
         str(config_path),
     ]
 
-    proc = subprocess.run(  # nosec B603
-        cmd,
-        env=env,
-        capture_output=True,
-        text=True,
-        cwd=str(worker_root),
-    )
-
-    if proc.returncode != 0:
+    returncode, output = _run_wrangler(cmd, env=env, cwd=str(worker_root), echo=debug)
+    if returncode != 0:
         raise CloudflareAPIError(
             "Wrangler deploy failed for contact form worker "
-            f"(exit {proc.returncode}).\n\nSTDOUT:\n{proc.stdout}\n\nSTDERR:\n{proc.stderr}"
+            f"(exit {returncode}).\n\nOUTPUT:\n{output}"
         )
 
-    if debug:
-        print(proc.stdout.strip())
-
     return worker_name
 
 
@@ -370,8 +484,11 @@ def deploy_contact_form_worker(
 
 def _find_zone_id(config: Config) -> str:
     """Find and cache the Cloudflare zone ID for the root domain."""
-    if config.root_domain in _ZONE_CACHE:
-        return _ZONE_CACHE[config.root_domain]
+    cache_key = (config.cf_api_token, config.root_domain)
+    with _ZONE_CACHE_LOCK:
+        cached = _ZONE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     zones = _request(
         "GET",
@@ -382,25 +499,78 @@ def _find_zone_id(config: Config) -> str:
     if not zones:
         raise CloudflareAPIError(f"No Cloudflare zone found for {config.root_domain}")
     zone_id = zones[0]["id"]
-    _ZONE_CACHE[config.root_domain] = zone_id
+    with _ZONE_CACHE_LOCK:
+        _ZONE_CACHE[cache_key] = zone_id
     return zone_id
 
 
-def _ensure_dns_record(*, fqdn: str, target: str, config: Config) -> None:
+def _token_fingerprint(config: Config) -> str:
+    """Return a short hash of the API token, safe to write to cache files."""
+    return hashlib.sha256(config.cf_api_token.encode("utf-8")).hexdigest()[:16]
+
+
+def _zone_cache_key(config: Config) -> str:
+    """
+    Key a persisted zone ID by account, token and domain.
+
+    Different accounts or tokens may see different zones for the same domain, so an
+    entry written under one must not be served to another. The token is hashed so
+    the cache file never holds the secret.
+    """
+    return f"{config.cf_account_id}:{_token_fingerprint(config)}:{config.root_domain}"
+
+
+def _read_zone_cache(cache_path: Path, config: Config) -> str | None:
+    """Return a zone ID persisted by an earlier deploy if it is still fresh."""
+    try:
+        entries = json.loads(cache_path.read_text(encoding="utf-8"))
+        entry = entries[_zone_cache_key(config)]
+        if time.time() - float(entry["cached_at"]) < ZONE_CACHE_TTL_SECONDS:
+            return str(entry["zone_id"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_zone_cache(cache_path: Path, config: Config, zone_id: str) -> None:
+    """Persist the zone ID for the configured root domain alongside any other cached entries."""
+    try:
+        entries = json.loads(cache_path.read_text(encoding="utf-8"))
+        if not isinstance(entries, dict):
+            entries = {}
+    except (OSError, ValueError):
+        entries = {}
+    entries[_zone_cache_key(config)] = {"zone_id": zone_id, "cached_at": time.time()}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+    except OSError:
+        # The cache is an optimization only; a read-only checkout just loses it.
+        pass
+
+
+def _ensure_dns_record(*, fqdn: str, target: str, config: Config, zone_id: str | None = None) -> None:
     """
     Ensure fqdn is a CNAME pointing at target in the root zone.
+
+    Pass zone_id when it is already known to skip the zone lookup.
     """
-    zone_id = _find_zone_id(config)
+    if zone_id is None:
+        zone_id = _find_zone_id(config)
     base_path = f"/zones/{zone_id}/dns_records"
 
-    records: List[Dict[str, Any]] = _request(
-        "GET",
-        base_path,
-        config,
-        params={"name": fqdn, "type": "CNAME"},
-    )
+    def _find_existing() -> Dict[str, Any] | None:
+        """Return the current CNAME record for fqdn, if any."""
+        records: List[Dict[str, Any]] = _request(
+            "GET",
+            base_path,
+            config,
+            # Only the first match is used; ask for exactly one record instead of a full page.
+            params={"name": fqdn, "type": "CNAME", "per_page": 1},
+        )
+        return records[0] if records else None
 
-    existing: Dict[str, Any] | None = records[0] if records else None
+    existing = _find_existing()
 
     payload: Dict[str, str | bool] = {
         "type": "CNAME",
@@ -410,61 +580,197 @@ def _ensure_dns_record(*, fqdn: str, target: str, config: Config) -> None:
     }
 
     if existing and existing.get("content") == target:
-        print(f"DNS already points {fqdn} -> {target}")
+        logger.info("DNS already points %s -> %s", fqdn, target)
         return
 
     if existing:
         _request("PUT", f"{base_path}/{existing['id']}", config, json=payload)
-        print(f"Updated DNS record: {fqdn} -> {target}")
+        logger.info("Updated DNS record: %s -> %s", fqdn, target)
     else:
-        _request("POST", base_path, config, json=payload)
-        print(f"Created DNS record: {fqdn} -> {target}")
+        try:
+            _request("POST", base_path, config, json=payload)
+        except CloudflareAPIError:
+            # Attaching the Pages domain runs concurrently and may create the CNAME itself
+            # for a same-account zone; reconcile against whatever record now exists.
+            existing = _find_existing()
+            if existing is None:
+                raise
+            if existing.get("content") != target:
+                _request("PUT", f"{base_path}/{existing['id']}", config, json=payload)
+            logger.info("DNS record for %s was created concurrently; now points -> %s", fqdn, target)
+            return
+        logger.info("Created DNS record: %s -> %s", fqdn, target)
+
+
+def _read_domain_cache(cache_path: Path, config: Config, domains_path: str) -> List[Dict[str, Any]] | None:
+    """Return a project's domain listing persisted by a deploy in the last minute, if any."""
+    key = f"{_token_fingerprint(config)}:{domains_path}"
+    with _DOMAIN_CACHE_LOCK:
+        try:
+            entry = json.loads(cache_path.read_text(encoding="utf-8"))[key]
+            if time.time() - float(entry["cached_at"]) < DOMAIN_CACHE_TTL_SECONDS:
+                return cast(List[Dict[str, Any]], entry["domains"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    return None
+
+
+def _write_domain_cache(
+    cache_path: Path,
+    config: Config,
+    domains_path: str,
+    domains: List[Dict[str, Any]] | None,
+) -> None:
+    """Persist a project's domain listing, or drop it when domains is None."""
+    key = f"{_token_fingerprint(config)}:{domains_path}"
+    with _DOMAIN_CACHE_LOCK:
+        try:
+            entries = json.loads(cache_path.read_text(encoding="utf-8"))
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, ValueError):
+            entries = {}
+        if domains is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = {"domains": domains, "cached_at": time.time()}
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entries), encoding="utf-8")
+            # Atomic swap so a concurrent deploy never reads a half-written file.
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The cache is an optimization only; a read-only checkout just loses it.
+            pass
+
+
+def _list_project_domains(
+    domains_path: str,
+    config: Config,
+    cache_path: Path | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    List a Pages project's custom domains.
+
+    When cache_path is given, a listing fetched by a deploy in the last
+    DOMAIN_CACHE_TTL_SECONDS is reused, so back-to-back deploys skip the GET.
+    """
+    if cache_path is not None:
+        cached = _read_domain_cache(cache_path, config, domains_path)
+        if cached is not None:
+            return cached
+    domains: List[Dict[str, Any]] = _request("GET", domains_path, config) or []
+    if cache_path is not None:
+        _write_domain_cache(cache_path, config, domains_path, domains)
+    return domains
 
 
-def ensure_custom_domain(*, slug: str, project_name: str, config: Config) -> str:
+def _ensure_dns_record_refreshing_zone(
+    *,
+    fqdn: str,
+    target: str,
+    config: Config,
+    zone_id: str,
+    stale_zone_cache_path: Path | None,
+) -> None:
+    """
+    Ensure the DNS CNAME, re-resolving the zone once if a disk-cached zone ID is gone.
+
+    stale_zone_cache_path is the zone cache file when zone_id came from it, else None.
+    """
+    try:
+        _ensure_dns_record(fqdn=fqdn, target=target, config=config, zone_id=zone_id)
+    except CloudflareAPIError as exc:
+        if stale_zone_cache_path is None or exc.status_code != 404:
+            raise
+        # The persisted zone no longer exists; forget it and resolve it again.
+        with _ZONE_CACHE_LOCK:
+            _ZONE_CACHE.pop((config.cf_api_token, config.root_domain), None)
+        zone_id = _find_zone_id(config)
+        _write_zone_cache(stale_zone_cache_path, config, zone_id)
+        _ensure_dns_record(fqdn=fqdn, target=target, config=config, zone_id=zone_id)
+
+
+def ensure_custom_domain(
+    *,
+    slug: str,
+    project_name: str,
+    config: Config,
+    project_root: Path | None = None,
+) -> str:
     """
     Attach slug.root_domain as a custom domain to the given Pages project and
     ensure the DNS CNAME is present.
 
+    When project_root is given, the zone ID and the project's domain listing are
+    persisted under its cache directory so later deploys skip those lookups. The DNS record and the
+    Pages domain attachment are independent, so they are reconciled concurrently.
+
     Returns the fully qualified domain name.
     """
     fqdn = f"{slug}.{config.root_domain}"
     domains_path = (
         f"/accounts/{config.cf_account_id}/pages/projects/{project_name}/domains"
     )
-
-    domains: List[Dict[str, Any]] = _request("GET", domains_path, config)
-    existing: Dict[str, Any] | None = None
-    for d in domains:
-        if d.get("name") == fqdn:
-            existing = d
-            break
-
-    domain: Dict[str, Any]
-    if existing:
-        domain = existing
-        print(
-            f"Custom domain already configured: {fqdn} "
-            f"(status: {domain.get('status')})"
-        )
-    else:
-        domain: Dict[str, Any] = _request(
-            "POST", domains_path, config, json={"name": fqdn}
+    pages_hostname = f"{project_name}.pages.dev"
+    zone_cache_path = cache_dir(project_root) / ZONE_CACHE_FILE_NAME if project_root else None
+    domain_cache_path = cache_dir(project_root) / DOMAIN_CACHE_FILE_NAME if project_root else None
+    zone_id = _read_zone_cache(zone_cache_path, config) if zone_cache_path else None
+    zone_from_disk = zone_id is not None
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if zone_id is None:
+            # The zone lookup and the domain listing are independent; overlap the two round-trips.
+            zone_future = executor.submit(_find_zone_id, config)
+            domains_future = executor.submit(_list_project_domains, domains_path, config, domain_cache_path)
+            zone_id = zone_future.result()
+            if zone_cache_path:
+                _write_zone_cache(zone_cache_path, config, zone_id)
+        else:
+            domains_future = None
+
+        dns_future = executor.submit(
+            _ensure_dns_record_refreshing_zone,
+            fqdn=fqdn,
+            target=pages_hostname,
+            config=config,
+            zone_id=zone_id,
+            stale_zone_cache_path=zone_cache_path if zone_from_disk else None,
         )
-        existing = domain
-        print(
-            f"Added custom domain: {fqdn} "
-            f"(status: {domain.get('status')})"
+
+        domains = (
+            domains_future.result()
+            if domains_future is not None
+            else _list_project_domains(domains_path, config, domain_cache_path)
         )
 
-    pages_hostname = f"{project_name}.pages.dev"
-    _ensure_dns_record(fqdn=fqdn, target=pages_hostname, config=config)
+        existing: Dict[str, Any] | None = None
+        for d in domains:
+            if d.get("name") == fqdn:
+                existing = d
+                break
+
+        domain: Dict[str, Any]
+        if existing:
+            domain = existing
+            logger.info("Custom domain already configured: %s (status: %s)", fqdn, domain.get("status"))
+        else:
+            domain: Dict[str, Any] = _request(
+                "POST", domains_path, config, json={"name": fqdn}
+            )
+            if domain_cache_path is not None:
+                _write_domain_cache(domain_cache_path, config, domains_path, None)
+            existing = domain
+            logger.info("Added custom domain: %s (status: %s)", fqdn, domain.get("status"))
+
+        dns_future.result()
 
     status: str | None = cast(str | None, domain.get("status"))
     if status and status != "active":
-        print(
-            "Domain verification pending "
-            f"(status: {status}). DNS and TLS may take a few minutes to finalize."
+        logger.info(
+            "Domain verification pending (status: %s). DNS and TLS may take a few minutes to finalize.",
+            status,
         )
 
     return fqdn
@@ -11,6 +11,31 @@ load_dotenv()
 _REDACTED_VALUE = "<redacted>"
 
 
+@overload
+def _get_env(name: str, *, required: Literal[True] = True, default: None = None) -> str:
+    ...
+
+
+@overload
+def _get_env(name: str, *, required: Literal[False], default: str) -> str:
+    ...
+
+
+@overload
+def _get_env(name: str, *, required: Literal[False], default: None = None) -> str | None:
+    ...
+
+
+def _get_env(name: str, *, required: bool = True, default: str | None = None) -> str | None:
+    """Read an environment variable with optional defaults and validation."""
+    value = os.getenv(name)
+    if value is None:
+        value = default
+    if required and not value:
+        raise RuntimeError(f"Missing required environment variable: {name}")
+    return value
+
+
 @dataclass
 class Config:
     """Runtime configuration for landing-genie."""
@@ -48,29 +73,8 @@ class Config:
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from environment variables."""
-        @overload
-        def _get(name: str, *, required: Literal[True] = True, default: None = None) -> str:
-            ...
-
-        @overload
-        def _get(name: str, *, required: Literal[False], default: str) -> str:
-            ...
-
-        @overload
-        def _get(name: str, *, required: Literal[False], default: None = None) -> str | None:
-            ...
-
-        def _get(name: str, *, required: bool = True, default: str | None = None) -> str | None:
-            """Read an environment variable with optional defaults and validation."""
-            value = os.getenv(name)
-            if value is None:
-                value = default
-            if required and not value:
-                raise RuntimeError(f"Missing required environment variable: {name}")
-            return value
-
-        image_cost_str = _get("GEMINI_IMAGE_OUTPUT_COST_PER_1K_TOKENS", required=False, default=None)
-        image_input_cost_str = _get("GEMINI_IMAGE_INPUT_COST_PER_1K_TOKENS", required=False, default=None)
+        image_cost_str = _get_env("GEMINI_IMAGE_OUTPUT_COST_PER_1K_TOKENS", required=False, default=None)
+        image_input_cost_str = _get_env("GEMINI_IMAGE_INPUT_COST_PER_1K_TOKENS", required=False, default=None)
         image_cost_per_1k_tokens: float | None
         image_input_cost_per_1k_tokens: float | None
         if image_cost_str is None or image_cost_str == "":
@@ -92,15 +96,15 @@ class Config:
                 )
 
         return cls(
-            root_domain=_get("ROOT_DOMAIN"),
-            cf_account_id=_get("CLOUDFLARE_ACCOUNT_ID"),
-            cf_api_token=_get("CLOUDFLARE_API_TOKEN"),
-            lead_to_email=_get("LEAD_TO_EMAIL", required=False, default=None),
-            gemini_code_model=_get("GEMINI_CODE_MODEL", required=False, default="gemini-2.5-pro"),
-            gemini_image_model=_get("GEMINI_IMAGE_MODEL", required=False, default="gemini-2.5-flash-image"),
-            gemini_cli_command=_get("GEMINI_CLI_COMMAND", required=False, default="gemini"),
-            gemini_api_key=_get("GEMINI_API_KEY", required=False, default=None),
-            gemini_telemetry_otlp_endpoint=_get("GEMINI_TELEMETRY_OTLP_ENDPOINT", required=False, default=None),
+            root_domain=_get_env("ROOT_DOMAIN"),
+            cf_account_id=_get_env("CLOUDFLARE_ACCOUNT_ID"),
+            cf_api_token=_get_env("CLOUDFLARE_API_TOKEN"),
+            lead_to_email=_get_env("LEAD_TO_EMAIL", required=False, default=None),
+            gemini_code_model=_get_env("GEMINI_CODE_MODEL", required=False, default="gemini-2.5-pro"),
+            gemini_image_model=_get_env("GEMINI_IMAGE_MODEL", required=False, default="gemini-2.5-flash-image"),
+            gemini_cli_command=_get_env("GEMINI_CLI_COMMAND", required=False, default="gemini"),
+            gemini_api_key=_get_env("GEMINI_API_KEY", required=False, default=None),
+            gemini_telemetry_otlp_endpoint=_get_env("GEMINI_TELEMETRY_OTLP_ENDPOINT", required=False, default=None),
             gemini_image_cost_per_1k_tokens=image_cost_per_1k_tokens,
             gemini_image_input_cost_per_1k_tokens=image_input_cost_per_1k_tokens,
         )
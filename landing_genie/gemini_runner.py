@@ -4,14 +4,20 @@ from __future__ import annotations
 import json
 import os
 import re
+import shutil
 import subprocess  # nosec B404
+import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Iterator, Mapping, Optional, cast
 
 from .config import Config
 from .site_paths import normalize_site_dir
+from .text_utils import strip_code_fences
 
 
 def _env_int(name: str, default: int, *, min_value: int = 1) -> int:
@@ -34,18 +40,37 @@ PROMPT_LOG_MAX_MB_ENV_VAR = "LANDING_GENIE_PROMPT_LOG_MAX_MB"
 DEFAULT_PROMPT_LOG_MAX_MB = 5
 DEFAULT_PROMPT_LOG_MAX_BYTES = DEFAULT_PROMPT_LOG_MAX_MB * 1024 * 1024
 DEFAULT_PROMPT_LOG_PATH = ".log/"
+LOG_COPY_CHUNK_BYTES = 64 * 1024
+GEMINI_ARGV_PROMPT_MAX_BYTES = 128 * 1024
+# Serializes prompt log appends and trims across worker threads.
+_PROMPT_LOG_LOCK = threading.Lock()
+
+
+# Characters a JSON value can start with (including the NaN/Infinity literals the decoder
+# accepts); raw_decode fails everywhere else, so the scan can jump straight between them.
+_JSON_VALUE_START_RE = re.compile(r"[{\[\"\-0-9tfnNI]")
 
 
 def _iter_json_objects(text: str) -> Iterator[dict[str, Any]]:
     """Yield JSON objects from a stream that may contain multiple blobs and noise."""
+    # Common case: --output-format json prints exactly one document, which a single
+    # json.loads handles without the incremental scan.
+    try:
+        whole = json.loads(text)
+    except ValueError:
+        pass
+    else:
+        if isinstance(whole, dict):
+            yield whole
+        return
+
     decoder = json.JSONDecoder()
     idx = 0
-    length = len(text)
-    while idx < length:
-        while idx < length and text[idx].isspace():
-            idx += 1
-        if idx >= length:
+    while True:
+        match = _JSON_VALUE_START_RE.search(text, idx)
+        if match is None:
             break
+        idx = match.start()
         try:
             obj, end = decoder.raw_decode(text, idx)
         except json.JSONDecodeError:
@@ -56,6 +81,46 @@ def _iter_json_objects(text: str) -> Iterator[dict[str, Any]]:
         idx = end
 
 
+# Built once so the casts in _extract_usage don't create a new dict[str, Any] alias per JSON object.
+_JsonObject = dict[str, Any]
+_USAGE_RE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+# Every token-count source below (usageMetadata fields, stats.tokens, gen_ai.usage.*_tokens and the
+# text fallbacks) contains "token", so output without it cannot carry usage data.
+_TOKEN_MARKER_RE = re.compile("token", re.IGNORECASE)
+# One alternation for the three direct usage keys. A match spans only key, quote, separator and
+# digits, so no other key can start inside it and one finditer pass finds each key's first hit.
+_USAGE_KEYS_RE = re.compile(
+    r"(?:(?P<prompt>promptTokenCount)|(?P<completion>candidatesTokenCount|output_tokens)|(?P<total>totalTokenCount))"
+    r"['\"]?\s*[:=]\s*(?P<value>\d+)",
+    _USAGE_RE_FLAGS,
+)
+# The gap after "tokens" is bounded: an unbounded lazy gap made these searches quadratic on long
+# output with many "tokens" words and no match (seconds of CPU per 100 KB).
+_STATS_TOTAL_RE = re.compile(r"tokens[^{}]{0,512}?total['\"]?\s*[:=]\s*(\d+)", _USAGE_RE_FLAGS)
+_STATS_PROMPT_RE = re.compile(r"tokens[^{}]{0,512}?(?:input|prompt)['\"]?\s*[:=]\s*(\d+)", _USAGE_RE_FLAGS)
+_STATS_COMPLETION_RE = re.compile(r"tokens[^{}]{0,512}?(?:output|completion)['\"]?\s*[:=]\s*(\d+)", _USAGE_RE_FLAGS)
+_STATS_ANCHOR_RE = re.compile("tokens", re.IGNORECASE)
+# Literal keys the JSON pass of _extract_usage looks up (JSON keys are always double-quoted).
+_USAGE_JSON_MARKERS = ("usageMetadata", '"stats"', "gen_ai.usage.")
+
+
+def _scan_usage_keys(text: str) -> dict[str, int]:
+    """Return the first prompt/completion/total value written as a usage key in text."""
+    found: dict[str, int] = {}
+    for match in _USAGE_KEYS_RE.finditer(text):
+        kind = next(name for name in ("prompt", "completion", "total") if match.group(name) is not None)
+        found.setdefault(kind, int(match.group("value")))
+        if len(found) == 3:
+            break
+    return found
+
+
+def _first_int(pattern: re.Pattern[str], text: str, pos: int = 0) -> Optional[int]:
+    """Return the pattern's first group as an int if it matches at or after pos."""
+    match = pattern.search(text, pos)
+    return int(match.group(1)) if match else None
+
+
 def _extract_usage(stdout: str, model: str) -> tuple[Optional[int], Optional[int], Optional[int]]:
     """
     Parse Gemini CLI stdout to find token counts.
@@ -64,6 +129,9 @@ def _extract_usage(stdout: str, model: str) -> tuple[Optional[int], Optional[int
     first, then fall back to regex against the raw text for inspected output that
     isn't valid JSON (e.g., single-quoted).
     """
+    if not _TOKEN_MARKER_RE.search(stdout):
+        return None, None, None
+
     found_prompt: Optional[int] = None
     found_completion: Optional[int] = None
     found_total: Optional[int] = None
@@ -72,41 +140,40 @@ def _extract_usage(stdout: str, model: str) -> tuple[Optional[int], Optional[int
         """Return the value if it is an int."""
         return value if isinstance(value, int) else None
 
-    for obj in _iter_json_objects(stdout):
+    # Only decode JSON when one of the keys read below can be present; otherwise go straight to the regexes.
+    has_json_usage = any(marker in stdout for marker in _USAGE_JSON_MARKERS)
+    for obj in _iter_json_objects(stdout) if has_json_usage else ():
         usage = obj.get("usageMetadata")
         if isinstance(usage, dict):
-            usage_dict = cast(dict[str, Any], usage)
+            usage_dict = cast(_JsonObject, usage)
             return (
                 _int_or_none(usage_dict.get("promptTokenCount")),
                 _int_or_none(usage_dict.get("candidatesTokenCount")),
                 _int_or_none(usage_dict.get("totalTokenCount")),
             )
 
+        # Most blobs carry none of these keys; one lookup each, no placeholder dicts.
         stats = obj.get("stats")
-        model_stats: dict[str, Any] = {}
+        tokens_entry: Any = None
         if isinstance(stats, dict):
-            stats_dict = cast(dict[str, Any], stats)
+            stats_dict = cast(_JsonObject, stats)
             models = stats_dict.get("models")
             if isinstance(models, dict):
-                models_dict = cast(dict[str, Any], models)
+                models_dict = cast(_JsonObject, models)
                 model_entry = models_dict.get(model)
                 if isinstance(model_entry, dict):
-                    model_stats = cast(dict[str, Any], model_entry)
-
-        tokens: dict[str, Any] = {}
-        tokens_entry = model_stats.get("tokens")
-        if isinstance(tokens_entry, dict):
-            tokens = cast(dict[str, Any], tokens_entry)
-        if tokens:
+                    tokens_entry = cast(_JsonObject, model_entry).get("tokens")
+        if isinstance(tokens_entry, dict) and tokens_entry:
+            tokens = cast(_JsonObject, tokens_entry)
             return (
                 _int_or_none(tokens.get("input") or tokens.get("prompt")),
                 _int_or_none(tokens.get("output") or tokens.get("completion")),
                 _int_or_none(tokens.get("total")),
             )
 
-        attrs = obj.get("attributes", {})
+        attrs = obj.get("attributes")
         if isinstance(attrs, dict):
-            attrs_dict = cast(dict[str, Any], attrs)
+            attrs_dict = cast(_JsonObject, attrs)
             input_tokens = _int_or_none(attrs_dict.get("gen_ai.usage.input_tokens"))
             output_tokens = _int_or_none(attrs_dict.get("gen_ai.usage.output_tokens"))
         else:
@@ -115,41 +182,54 @@ def _extract_usage(stdout: str, model: str) -> tuple[Optional[int], Optional[int
             total_tokens = None
             if input_tokens is not None and output_tokens is not None:
                 total_tokens = input_tokens + output_tokens
-            found_prompt = found_prompt or input_tokens
-            found_completion = found_completion or output_tokens
-            found_total = found_total or total_tokens
+            if found_prompt is None:
+                found_prompt = input_tokens
+            if found_completion is None:
+                found_completion = output_tokens
+            if found_total is None:
+                found_total = total_tokens
+
+    if found_prompt is not None and found_completion is not None and found_total is not None:
+        return found_prompt, found_completion, found_total
 
     # Regex fallback for non-JSON telemetry output (single-quoted or inspected dicts).
-    def _m(pattern: str) -> Optional[int]:
-        """Return the first regex group as an int if present."""
-        match = re.search(pattern, stdout, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-        return int(match.group(1)) if match else None
-
-    prompt_tokens: Optional[int] = found_prompt or _m(r"promptTokenCount['\"]?\s*[:=]\s*(\d+)")
-    completion_tokens: Optional[int] = found_completion or _m(r"(?:candidatesTokenCount|output_tokens)['\"]?\s*[:=]\s*(\d+)")
-    total_tokens: Optional[int] = found_total or _m(r"totalTokenCount['\"]?\s*[:=]\s*(\d+)")
-
-    if total_tokens is None:
-        total_tokens = _m(r"tokens[^{}]*?total['\"]?\s*[:=]\s*(\d+)")
-    if prompt_tokens is None:
-        prompt_tokens = _m(r"tokens[^{}]*?(?:input|prompt)['\"]?\s*[:=]\s*(\d+)")
-    if completion_tokens is None:
-        completion_tokens = _m(r"tokens[^{}]*?(?:output|completion)['\"]?\s*[:=]\s*(\d+)")
+    # A legitimate count of 0 from the JSON pass is kept rather than re-searched.
+    direct = _scan_usage_keys(stdout)
+    prompt_tokens: Optional[int] = found_prompt if found_prompt is not None else direct.get("prompt")
+    completion_tokens: Optional[int] = found_completion if found_completion is not None else direct.get("completion")
+    total_tokens: Optional[int] = found_total if found_total is not None else direct.get("total")
+
+    if total_tokens is None or prompt_tokens is None or completion_tokens is None:
+        # The stats patterns all begin with "tokens"; locate it once and start every search there.
+        tokens_match = _STATS_ANCHOR_RE.search(stdout)
+        if tokens_match is not None:
+            start = tokens_match.start()
+            if total_tokens is None:
+                total_tokens = _first_int(_STATS_TOTAL_RE, stdout, start)
+            if prompt_tokens is None:
+                prompt_tokens = _first_int(_STATS_PROMPT_RE, stdout, start)
+            if completion_tokens is None:
+                completion_tokens = _first_int(_STATS_COMPLETION_RE, stdout, start)
 
     return prompt_tokens, completion_tokens, total_tokens
 
 
-def _strip_code_fences(text: str) -> str:
-    """
-    Remove surrounding Markdown fences such as ```json ... ``` or ``` ... ```.
-    """
-    match = re.match(r"\s*```(?:json)?\s*(.*?)\s*```\s*$", text, flags=re.DOTALL | re.IGNORECASE)
-    return match.group(1) if match else text.strip()
+def _truncate_for_debug(text: str, limit: int = 4000) -> str:
+    """Shorten CLI output for debug messages; only called once a message will be shown."""
+    return text if len(text) <= limit else text[:limit] + "...[truncated]"
 
 
 def _prompt_log_max_bytes() -> int:
     """Resolve the prompt log size cap in bytes."""
-    raw_mb = os.getenv(PROMPT_LOG_MAX_MB_ENV_VAR)
+    return _parse_prompt_log_max_bytes(
+        os.getenv(PROMPT_LOG_MAX_MB_ENV_VAR),
+        os.getenv(PROMPT_LOG_MAX_BYTES_ENV_VAR),
+    )
+
+
+@lru_cache(maxsize=8)
+def _parse_prompt_log_max_bytes(raw_mb: Optional[str], raw_bytes: Optional[str]) -> int:
+    """Parse the prompt log cap env values; keyed on the raw strings so env changes still apply."""
     if raw_mb:
         try:
             value_mb = float(raw_mb)
@@ -159,7 +239,6 @@ def _prompt_log_max_bytes() -> int:
         except ValueError:
             pass
 
-    raw_bytes = os.getenv(PROMPT_LOG_MAX_BYTES_ENV_VAR)
     if raw_bytes:
         try:
             value_bytes = int(raw_bytes)
@@ -191,35 +270,41 @@ def _enforce_log_cap(log_path: Path, max_bytes: int) -> None:
         return
     if size <= max_bytes:
         return
+    note = b"[truncated]\n"
+    keep = max_bytes - len(note) if max_bytes > len(note) else max(max_bytes, 0)
+    tmp_path = log_path.with_name(log_path.name + ".tmp")
     try:
-        with log_path.open("rb") as fh:
-            if max_bytes <= 0:
-                data = b""
-            else:
-                fh.seek(-max_bytes, os.SEEK_END)
-                data = fh.read()
-        note = b"[truncated]\n"
-        if max_bytes > len(note):
-            data = note + data[-(max_bytes - len(note)) :]
-        else:
-            data = data[-max_bytes:]
-        with log_path.open("wb") as fh:
-            fh.write(data)
+        # Stream the kept tail into a sibling file and swap it in, instead of
+        # holding the tail in memory and rewriting the log in place.
+        with log_path.open("rb") as src, tmp_path.open("wb") as dst:
+            if max_bytes > len(note):
+                dst.write(note)
+            if keep:
+                src.seek(-keep, os.SEEK_END)
+                shutil.copyfileobj(src, dst, LOG_COPY_CHUNK_BYTES)
+        os.replace(tmp_path, log_path)
     except Exception as exc:
+        tmp_path.unlink(missing_ok=True)
         print(f"[Gemini CLI debug] Failed to enforce prompt log cap: {exc}")
 
 
-def _append_prompt_log(entry: str) -> None:
-    """Append a text entry to the prompt log."""
-    log_path = _prompt_log_path()
-    if not log_path:
-        return
-
+def _append_prompt_log(log_path: Path, entry: str) -> None:
+    """Append a text entry to the prompt log resolved by the caller."""
     try:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as fh:
-            fh.write(entry)
-        _enforce_log_cap(log_path, _prompt_log_max_bytes())
+        data = entry.encode("utf-8")
+        max_bytes = _prompt_log_max_bytes()
+        with _PROMPT_LOG_LOCK:
+            try:
+                fh = log_path.open("ab")
+            except FileNotFoundError:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                fh = log_path.open("ab")
+            with fh:
+                fh.write(data)
+                # Appends leave the position at end of file, so this is the current size.
+                size = fh.tell()
+            if size > max_bytes:
+                _enforce_log_cap(log_path, max_bytes)
     except Exception as exc:
         print(f"[Gemini CLI debug] Failed to log prompt to {log_path}: {exc}")
 
@@ -238,7 +323,7 @@ def _log_prompt(prompt_text: str, model: str) -> None:
             f"{timestamp} | model={model}\n"
             f"{prompt_text}\n\n"
         )
-        _append_prompt_log(entry)
+        _append_prompt_log(log_path, entry)
     except Exception as exc:
         print(f"[Gemini CLI debug] Failed to log prompt to {log_path}: {exc}")
 
@@ -256,7 +341,7 @@ def _log_image_prompt_result(slot_src: str, prompt_text: str) -> None:
             f"{timestamp} | image-prompt result | slot={slot_src}\n"
             f"{prompt_text}\n\n"
         )
-        _append_prompt_log(entry)
+        _append_prompt_log(log_path, entry)
     except Exception as exc:
         print(f"[Gemini CLI debug] Failed to log image prompt result: {exc}")
 
@@ -270,8 +355,6 @@ def _parse_image_prompt_batch_response(stdout: str, *, debug: bool = False) -> d
         if debug_enabled:
             print(msg)
 
-    truncated = stdout if len(stdout) <= 4000 else stdout[:4000] + "...[truncated]"
-
     def _extract_from_text(text: str) -> dict[str, str]:
         """Extract prompt mappings from nested JSON/text content."""
         try:
@@ -306,7 +389,7 @@ def _parse_image_prompt_batch_response(stdout: str, *, debug: bool = False) -> d
                 nested = _extract_from_text(response_field)
                 if nested:
                     return nested
-        stripped = _strip_code_fences(text)
+        stripped = strip_code_fences(text)
         if stripped != text:
             nested = _extract_from_text(stripped)
             if nested:
@@ -315,7 +398,7 @@ def _parse_image_prompt_batch_response(stdout: str, *, debug: bool = False) -> d
 
     results = _extract_from_text(stdout)
     if not results:
-        _debug(f"[Gemini CLI debug] Could not parse batch image prompts from stdout:\n{truncated}")
+        _debug(f"[Gemini CLI debug] Could not parse batch image prompts from stdout:\n{_truncate_for_debug(stdout)}")
     return results
 
 
@@ -332,8 +415,6 @@ def _parse_product_slot_response(
         if debug_enabled:
             print(msg)
 
-    truncated = stdout if len(stdout) <= 4000 else stdout[:4000] + "...[truncated]"
-
     def _normalize_response(data: dict[str, Any]) -> tuple[str, list[str]] | None:
         """Normalize the slot response into (canonical_src, slots)."""
         if "canonical_src" not in data or "product_slots" not in data:
@@ -369,7 +450,7 @@ def _parse_product_slot_response(
                 nested = _extract_from_text(response_field)
                 if nested is not None:
                     return nested
-        stripped = _strip_code_fences(text)
+        stripped = strip_code_fences(text)
         if stripped != text:
             nested = _extract_from_text(stripped)
             if nested is not None:
@@ -378,7 +459,7 @@ def _parse_product_slot_response(
 
     parsed = _extract_from_text(stdout)
     if parsed is None:
-        _debug(f"[Gemini CLI debug] Could not parse product slot response from stdout:\n{truncated}")
+        _debug(f"[Gemini CLI debug] Could not parse product slot response from stdout:\n{_truncate_for_debug(stdout)}")
         return "", []
     return parsed
 
@@ -410,10 +491,10 @@ def _validate_product_slot_selection(
     return canonical_src, product_slots
 
 
-def _extract_questions_from_obj(obj: Mapping[str, Any]) -> list[str]:
-    """Extract a questions list from a JSON object."""
+def _extract_questions_from_obj(obj: Mapping[str, Any], key: str = "questions") -> list[str]:
+    """Extract a questions list stored under `key` from a JSON object."""
     questions: list[str] = []
-    raw = obj.get("questions")
+    raw = obj.get(key)
     if isinstance(raw, list):
         for q in cast(list[object], raw):
             if isinstance(q, str):
@@ -423,6 +504,10 @@ def _extract_questions_from_obj(obj: Mapping[str, Any]) -> list[str]:
     return questions
 
 
+# Bullet, numbering and spacing characters stripped from the start of plain-text question lines.
+_QUESTION_LINE_PREFIX_CHARS = "-•0123456789.) "
+
+
 def _parse_questions_from_text(text: str) -> list[str]:
     """Parse questions from either JSON or plain text."""
     questions: list[str] = []
@@ -441,12 +526,19 @@ def _parse_questions_from_text(text: str) -> list[str]:
                     q_clean = q.strip()
                     if q_clean:
                         questions.append(q_clean)
-        if questions:
-            return questions
+        # A JSON object cannot hold a raw line ending in "?", so the line scan below
+        # could never find anything in it.
+        return questions
 
+    if "?" not in text:
+        return questions
     for line in text.splitlines():
-        cleaned = line.strip().lstrip("-•0123456789.) ")
-        if cleaned.endswith("?") and len(cleaned) > 6:
+        # Neither strip below can remove a trailing "?", so test it before building copies.
+        stripped = line.rstrip()
+        if not stripped.endswith("?"):
+            continue
+        cleaned = stripped.lstrip().lstrip(_QUESTION_LINE_PREFIX_CHARS)
+        if len(cleaned) > 6:
             questions.append(cleaned)
     return questions
 
@@ -460,8 +552,8 @@ def _parse_follow_up_questions(stdout: str, *, debug: bool = False) -> list[str]
         if debug_enabled:
             print(msg)
 
-    truncated_stdout = stdout if len(stdout) <= 4000 else stdout[:4000] + "...[truncated]"
-    _debug(f"[Gemini CLI debug] Raw follow-up stdout ({len(stdout)} chars):\n{truncated_stdout}")
+    if debug_enabled:
+        _debug(f"[Gemini CLI debug] Raw follow-up stdout ({len(stdout)} chars):\n{_truncate_for_debug(stdout)}")
 
     try:
         outer_raw = json.loads(stdout)
@@ -485,18 +577,16 @@ def _parse_follow_up_questions(stdout: str, *, debug: bool = False) -> list[str]
         _debug("[Gemini CLI debug] Follow-up response missing or not a string; falling back to text parsing.")
         return _parse_questions_from_text(stdout)
 
-    stripped = _strip_code_fences(response_text)
+    stripped = strip_code_fences(response_text)
     if stripped != response_text:
         _debug("[Gemini CLI debug] Stripped Markdown code fences from follow-up response.")
 
-    truncated_response = stripped if len(stripped) <= 4000 else stripped[:4000] + "...[truncated]"
-
     try:
         inner_raw = json.loads(stripped)
     except json.JSONDecodeError as exc:
         _debug(
             "[Gemini CLI debug] Follow-up response was not valid JSON; "
-            f"raw response:\n{truncated_response}"
+            f"raw response:\n{_truncate_for_debug(stripped)}"
         )
         return _parse_questions_from_text(stripped)
 
@@ -514,6 +604,54 @@ def _parse_follow_up_questions(stdout: str, *, debug: bool = False) -> list[str]
     return _parse_questions_from_text(stripped)
 
 
+def _parse_combined_follow_up_questions(stdout: str, *, debug: bool = False) -> tuple[list[str], list[str]]:
+    """
+    Parse a combined follow-up response into (text_questions, image_questions).
+
+    Raises ValueError when neither list can be found so callers can fall back to
+    separate requests.
+    """
+    debug_enabled = debug or bool(os.getenv("LANDING_GENIE_DEBUG"))
+
+    def _split(obj: Mapping[str, Any]) -> tuple[list[str], list[str]] | None:
+        """Return both lists when the object holds at least one of them."""
+        text_questions = _extract_questions_from_obj(obj, "text_questions")
+        image_questions = _extract_questions_from_obj(obj, "image_questions")
+        if text_questions or image_questions:
+            return text_questions, image_questions
+        return None
+
+    try:
+        outer_raw = json.loads(stdout)
+    except json.JSONDecodeError as exc:
+        raise ValueError("Gemini combined follow-up response was not valid JSON") from exc
+    if not isinstance(outer_raw, dict):
+        raise ValueError("Gemini combined follow-up response must be a JSON object")
+    outer = cast(dict[str, Any], outer_raw)
+
+    direct = _split(outer)
+    if direct is not None:
+        return direct
+
+    response_field = outer.get("response")
+    if isinstance(response_field, str):
+        try:
+            inner_raw = json.loads(strip_code_fences(response_field))
+        except json.JSONDecodeError:
+            inner_raw = None
+        if isinstance(inner_raw, dict):
+            inner = _split(cast(dict[str, Any], inner_raw))
+            if inner is not None:
+                return inner
+
+    if debug_enabled:
+        print(
+            "[Gemini CLI debug] Could not parse combined follow-up questions from stdout:\n"
+            f"{_truncate_for_debug(stdout)}"
+        )
+    raise ValueError("Gemini combined follow-up response contained no question lists")
+
+
 def _dedupe_questions(questions: list[str], max_questions: int) -> list[str]:
     """Deduplicate and filter questions to a maximum count."""
     deduped: list[str] = []
@@ -522,14 +660,11 @@ def _dedupe_questions(questions: list[str], max_questions: int) -> list[str]:
     def _keep(question: str) -> Optional[str]:
         """Return a cleaned question or None if it should be discarded."""
         cleaned = question.strip()
-        if not cleaned:
-            return None
-        if cleaned.replace(".", "").strip() == "":
-            return None
-        if cleaned in {"...", ".."}:
-            return None
         if len(cleaned) < 6:
             return None
+        # Ellipsis-only lines; stops at the first real character instead of copying the text.
+        if all(c == "." or c.isspace() for c in cleaned):
+            return None
         return cleaned
 
     for q in questions:
@@ -556,8 +691,6 @@ def _parse_image_prompt_response(stdout: str, *, debug: bool = False) -> Optiona
         if debug_enabled:
             print(msg)
 
-    truncated = stdout if len(stdout) <= 4000 else stdout[:4000] + "...[truncated]"
-
     def _extract_from_text(text: str) -> Optional[str]:
         """Extract a prompt from nested JSON/text."""
         try:
@@ -577,7 +710,7 @@ def _parse_image_prompt_response(stdout: str, *, debug: bool = False) -> Optiona
                 if nested:
                     return nested
 
-        stripped = _strip_code_fences(text)
+        stripped = strip_code_fences(text)
         if stripped != text:
             nested = _extract_from_text(stripped)
             if nested:
@@ -590,23 +723,64 @@ def _parse_image_prompt_response(stdout: str, *, debug: bool = False) -> Optiona
     if prompt:
         return prompt
 
-    _debug(f"[Gemini CLI debug] Could not parse image prompt from stdout:\n{truncated}")
+    _debug(f"[Gemini CLI debug] Could not parse image prompt from stdout:\n{_truncate_for_debug(stdout)}")
     return None
 
 
-def _load_prompt_snippets(project_root: Path) -> dict[str, str]:
+_PLACEHOLDER_RE = re.compile(r"\{\{ (\w+) \}\}")
+
+
+@lru_cache(maxsize=64)
+def _template_segments(template: str) -> tuple[str, ...]:
+    """Split a template into alternating literal text and placeholder names (names at odd indexes)."""
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def _render_template(template: str, values: Mapping[str, str]) -> str:
+    """
+    Fill `{{ name }}` placeholders by joining the template's cached segments.
+
+    Unknown placeholders are left as-is, and substituted values are never
+    re-scanned, so user text containing `{{ ... }}` is inserted verbatim.
+    """
+    parts = list(_template_segments(template))
+    for idx in range(1, len(parts), 2):
+        name = parts[idx]
+        parts[idx] = values.get(name, f"{{{{ {name} }}}}")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=32)
+def _load_template(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a prompt file; the mtime/size key makes an edited file miss the cache."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def _read_template(path: Path) -> str:
+    """Return the text of a prompt template, reusing the last read while it is unchanged."""
+    stat = path.stat()
+    return _load_template(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+_SNIPPET_HEADER_RE = re.compile(r"^##\s+([A-Za-z0-9_\-]+)\s*$", flags=re.MULTILINE)
+
+
+def _load_prompt_snippets(project_root: Path) -> Mapping[str, str]:
     """
     Load optional prompt snippets from prompts/snippets.md, split by `## name` headers.
     """
     snippets_path = project_root / "prompts" / "snippets.md"
-    if not snippets_path.exists():
-        return {}
-    content = snippets_path.read_text(encoding="utf-8")
-    pattern = re.compile(r"^##\s+([A-Za-z0-9_\-]+)\s*$", flags=re.MULTILINE)
-    matches = list(pattern.finditer(content))
-    if not matches:
+    try:
+        content = _read_template(snippets_path)
+    except FileNotFoundError:
         return {}
+    return _parse_prompt_snippets(content)
+
 
+@lru_cache(maxsize=8)
+def _parse_prompt_snippets(content: str) -> Mapping[str, str]:
+    """Split snippets.md content into named blocks; cached per file content, so returned read-only."""
+    matches = list(_SNIPPET_HEADER_RE.finditer(content))
     snippets: dict[str, str] = {}
     for idx, match in enumerate(matches):
         start = match.end()
@@ -614,7 +788,7 @@ def _load_prompt_snippets(project_root: Path) -> dict[str, str]:
         raw_block = content[start:end].lstrip("\n")
         # Preserve trailing newline to keep blocks separated when inserted.
         snippets[match.group(1)] = raw_block.rstrip() + "\n"
-    return snippets
+    return MappingProxyType(snippets)
 
 
 def suggest_follow_up_questions(
@@ -631,11 +805,13 @@ def suggest_follow_up_questions(
     if not template_path.exists():
         raise FileNotFoundError(f"Follow-up prompt template not found at {template_path}")
 
-    template = template_path.read_text(encoding="utf-8")
-    prompt_text = (
-        template
-        .replace("{{ product_prompt }}", product_prompt)
-        .replace("{{ max_follow_up_questions }}", str(MAX_FOLLOW_UP_QUESTIONS))
+    template = _read_template(template_path)
+    prompt_text = _render_template(
+        template,
+        {
+            "product_prompt": product_prompt,
+            "max_follow_up_questions": str(MAX_FOLLOW_UP_QUESTIONS),
+        },
     )
 
     stdout = _run_gemini(
@@ -672,11 +848,13 @@ def suggest_image_follow_up_questions(
     if not template_path.exists():
         return []
 
-    template = template_path.read_text(encoding="utf-8")
-    prompt_text = (
-        template
-        .replace("{{ product_prompt }}", product_prompt)
-        .replace("{{ max_follow_up_questions }}", str(MAX_IMAGE_FOLLOW_UP_QUESTIONS))
+    template = _read_template(template_path)
+    prompt_text = _render_template(
+        template,
+        {
+            "product_prompt": product_prompt,
+            "max_follow_up_questions": str(MAX_IMAGE_FOLLOW_UP_QUESTIONS),
+        },
     )
 
     stdout = _run_gemini(
@@ -692,6 +870,52 @@ def suggest_image_follow_up_questions(
     return _dedupe_questions(parsed_questions, max_questions)
 
 
+def suggest_all_follow_up_questions(
+    product_prompt: str,
+    project_root: Path,
+    config: Config,
+    max_questions: int = MAX_FOLLOW_UP_QUESTIONS,
+    max_image_questions: int = MAX_IMAGE_FOLLOW_UP_QUESTIONS,
+    debug: bool = False,
+) -> tuple[list[str], list[str]]:
+    """
+    Ask Gemini CLI once for both text and image clarifications.
+
+    Returns (text_questions, image_questions). Raises FileNotFoundError/ValueError when
+    the combined template is missing or the response cannot be split, so callers can
+    fall back to suggest_follow_up_questions + suggest_image_follow_up_questions.
+    """
+    prompts_dir = project_root / "prompts"
+    template_path = prompts_dir / "combined_follow_up_questions_prompt.md"
+    if not template_path.exists():
+        raise FileNotFoundError(f"Combined follow-up prompt template not found at {template_path}")
+
+    template = _read_template(template_path)
+    prompt_text = _render_template(
+        template,
+        {
+            "product_prompt": product_prompt,
+            "max_follow_up_questions": str(MAX_FOLLOW_UP_QUESTIONS),
+            "max_image_follow_up_questions": str(MAX_IMAGE_FOLLOW_UP_QUESTIONS),
+        },
+    )
+
+    stdout = _run_gemini(
+        prompt_text,
+        config.gemini_code_model,
+        config,
+        output_format="json",
+        capture_output=True,
+        debug=debug,
+    ) or ""
+
+    text_questions, image_questions = _parse_combined_follow_up_questions(stdout, debug=debug)
+    return (
+        _dedupe_questions(text_questions, max_questions),
+        _dedupe_questions(image_questions, max_image_questions),
+    )
+
+
 def generate_image_prompt(
     slot_src: str,
     slot_alt: str,
@@ -714,13 +938,15 @@ def generate_image_prompt(
         # Derive a human-friendly hint from the filename if no alt text exists.
         slot_alt_clean = Path(slot_src).stem.replace("-", " ").replace("_", " ")
 
-    template = template_path.read_text(encoding="utf-8")
-    prompt_text = (
-        template
-        .replace("{{ product_prompt }}", product_prompt)
-        .replace("{{ slot_src }}", slot_src)
-        .replace("{{ slot_alt }}", slot_alt_clean or "image for the landing page")
-        .replace("{{ image_follow_up_context }}", clarifications)
+    template = _read_template(template_path)
+    prompt_text = _render_template(
+        template,
+        {
+            "product_prompt": product_prompt,
+            "slot_src": slot_src,
+            "slot_alt": slot_alt_clean or "image for the landing page",
+            "image_follow_up_context": clarifications,
+        },
     )
 
     stdout = _run_gemini(
@@ -768,12 +994,14 @@ def generate_image_prompts_batch(
         if slot.get("src")
     )
 
-    template = template_path.read_text(encoding="utf-8")
-    prompt_text = (
-        template
-        .replace("{{ product_prompt }}", product_prompt)
-        .replace("{{ image_follow_up_context }}", clarifications)
-        .replace("{{ slot_list }}", slot_lines)
+    template = _read_template(template_path)
+    prompt_text = _render_template(
+        template,
+        {
+            "product_prompt": product_prompt,
+            "image_follow_up_context": clarifications,
+            "slot_list": slot_lines,
+        },
     )
 
     stdout = _run_gemini(
@@ -826,11 +1054,13 @@ def select_product_slots(
         if slot.get("src")
     )
 
-    template = template_path.read_text(encoding="utf-8")
-    prompt_text = (
-        template
-        .replace("{{ product_prompt }}", product_prompt)
-        .replace("{{ slot_list }}", slot_lines)
+    template = _read_template(template_path)
+    prompt_text = _render_template(
+        template,
+        {
+            "product_prompt": product_prompt,
+            "slot_list": slot_lines,
+        },
     )
 
     stdout = _run_gemini(
@@ -846,6 +1076,37 @@ def select_product_slots(
     return _validate_product_slot_selection(canonical_src, product_slots, slots)
 
 
+def _gemini_cli_env(config: Config) -> Optional[dict[str, str]]:
+    """
+    Return the environment for a Gemini CLI run, or None to inherit os.environ as is.
+
+    The environment is only copied when a variable actually has to change.
+    """
+    overrides: dict[str, str] = {}
+    remove_api_key = False
+    # Respect README guidance: keep CLI text calls on the CLI's own auth unless explicitly allowed.
+    allow_cli_api_key = os.getenv("GEMINI_ALLOW_CLI_API_KEY", "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+    if config.gemini_api_key and allow_cli_api_key:
+        overrides["GEMINI_API_KEY"] = config.gemini_api_key
+    else:
+        remove_api_key = "GEMINI_API_KEY" in os.environ
+    if config.gemini_telemetry_otlp_endpoint:
+        # Override the CLI's telemetry endpoint when running headless so OTLP export is enabled.
+        overrides["GEMINI_TELEMETRY_OTLP_ENDPOINT"] = config.gemini_telemetry_otlp_endpoint
+
+    if not remove_api_key and all(os.environ.get(key) == value for key, value in overrides.items()):
+        return None
+    env = os.environ | overrides
+    if remove_api_key:
+        env.pop("GEMINI_API_KEY", None)
+    return env
+
+
 def _run_gemini(
     prompt_text: str,
     model: str,
@@ -868,22 +1129,14 @@ def _run_gemini(
     ]
     if output_format:
         cmd.extend(["--output-format", output_format])
-    cmd.append(prompt_text)
-    env = os.environ.copy()
-    # Respect README guidance: keep CLI text calls on the CLI's own auth unless explicitly allowed.
-    allow_cli_api_key = os.getenv("GEMINI_ALLOW_CLI_API_KEY", "").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    }
-    if config.gemini_api_key and allow_cli_api_key:
-        env["GEMINI_API_KEY"] = config.gemini_api_key
+    # Linux rejects any single argv string over 128 KiB (E2BIG); the CLI reads piped
+    # stdin as the prompt, so oversized prompts go there instead.
+    prompt_input: Optional[str] = None
+    if len(prompt_text.encode("utf-8")) < GEMINI_ARGV_PROMPT_MAX_BYTES:
+        cmd.append(prompt_text)
     else:
-        env.pop("GEMINI_API_KEY", None)
-    if config.gemini_telemetry_otlp_endpoint:
-        # Override the CLI's telemetry endpoint when running headless so OTLP export is enabled.
-        env["GEMINI_TELEMETRY_OTLP_ENDPOINT"] = config.gemini_telemetry_otlp_endpoint
+        prompt_input = prompt_text
+    env = _gemini_cli_env(config)
     start_time = time.monotonic()
     stop_event = threading.Event()
     last_msg_len = 0
@@ -892,8 +1145,9 @@ def _run_gemini(
         """Print a single-line status update."""
         nonlocal last_msg_len
         line = f"[Gemini CLI] {status} {elapsed:.1f} s"
-        padding = max(0, last_msg_len - len(line))
-        print(f"\r{line}{' ' * padding}", end="", flush=True)
+        # ljust pads over any longer previous line in the same allocation.
+        sys.stdout.write("\r" + line.ljust(last_msg_len))
+        sys.stdout.flush()
         last_msg_len = len(line)
 
     def _tick() -> None:
@@ -902,29 +1156,39 @@ def _run_gemini(
             _print_status("Running...", time.monotonic() - start_time)
 
     _print_status("Running...", 0.0)
-    progress_thread = threading.Thread(target=_tick, daemon=True)
-    progress_thread.start()
+    # Redrawing the status line only helps a terminal; piped output just gets the start and end lines.
+    # Runs on worker threads (parallel slot prompts, generate_sites) skip it too, so
+    # concurrent calls don't overwrite each other's line.
+    progress_thread: Optional[threading.Thread] = None
+    if sys.stdout.isatty() and threading.current_thread() is threading.main_thread():
+        progress_thread = threading.Thread(target=_tick, daemon=True)
+        progress_thread.start()
+
+    def _stop_progress() -> None:
+        """Stop the status ticker if one is running."""
+        stop_event.set()
+        if progress_thread is not None:
+            progress_thread.join(timeout=0.5)
 
     try:
         # Command uses configured CLI + generated prompt; no user-supplied shell expansion.
         result = subprocess.run(
             cmd,
-            cwd=str(cwd) if cwd is not None else None,
+            cwd=cwd,
             env=env,
+            input=prompt_input,
             capture_output=True,
             text=True,
         )
         elapsed = time.monotonic() - start_time
     except Exception:
         elapsed = time.monotonic() - start_time
-        stop_event.set()
-        progress_thread.join(timeout=0.5)
+        _stop_progress()
         _print_status("Failed after", elapsed)
         print()
         raise
 
-    stop_event.set()
-    progress_thread.join(timeout=0.5)
+    _stop_progress()
     _print_status("Completed in", elapsed)
     print()
 
@@ -959,14 +1223,17 @@ def generate_site(
     """Generate a landing page site using Gemini CLI."""
     prompts_dir = project_root / "prompts"
     template_path = prompts_dir / "runtime_generation_prompt.md"
-    if not template_path.exists():
-        raise FileNotFoundError(f"Prompt template not found at {template_path}")
+    try:
+        template = _read_template(template_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt template not found at {template_path}") from None
     from .site_paths import normalize_site_dir  # Local import to avoid cycles.
 
     site_dir = normalize_site_dir(slug, project_root)
-    site_dir.mkdir(parents=True, exist_ok=True)
+    # One stat in the common case; mkdir(exist_ok=True) would attempt the mkdir and then stat.
+    if not site_dir.is_dir():
+        site_dir.mkdir(parents=True, exist_ok=True)
 
-    template = template_path.read_text(encoding="utf-8")
     debug_enabled = debug or bool(os.getenv("LANDING_GENIE_DEBUG"))
     clarifications = follow_up_context or "None provided."
     snippets = _load_prompt_snippets(project_root)
@@ -975,41 +1242,74 @@ def generate_site(
     follow_up_block = ""
     if include_follow_up_context:
         block_template = snippet_template or default_follow_up_block
-        follow_up_block = block_template.replace("{{ follow_up_context }}", clarifications)
+        follow_up_block = _render_template(block_template, {"follow_up_context": clarifications})
     if debug_enabled:
         if follow_up_context:
             print(f"[Gemini CLI debug] Using follow-up clarifications:\n{follow_up_context}")
         else:
             print("[Gemini CLI debug] No follow-up clarifications provided; using 'None provided.'")
-    text = (
-        template
-        .replace("{{ slug }}", slug)
-        .replace("{{ root_domain }}", config.root_domain)
-        .replace("{{ product_prompt }}", product_prompt)
-        .replace("{{ product_type }}", "hybrid")
-        .replace("{{ follow_up_context }}", clarifications)
-        .replace("{{ follow_up_block }}", follow_up_block)
+    text = _render_template(
+        template,
+        {
+            "slug": slug,
+            "root_domain": config.root_domain,
+            "product_prompt": product_prompt,
+            "product_type": "hybrid",
+            "follow_up_context": clarifications,
+            "follow_up_block": follow_up_block,
+        },
     )
 
     _run_gemini(text, config.gemini_code_model, config, cwd=site_dir, debug=debug)
 
 
+def generate_sites(
+    items: list[tuple[str, str]],
+    project_root: Path,
+    config: Config,
+    *,
+    max_workers: int = 4,
+    debug: bool = False,
+) -> list[str]:
+    """
+    Generate several landing pages concurrently from (slug, product_prompt) pairs.
+
+    Each site is an independent Gemini CLI process, so threads only wait on
+    subprocesses; max_workers bounds how many run at once. Returns the slugs
+    in input order and re-raises the first failure.
+    """
+    if not items:
+        return []
+
+    def _generate(item: tuple[str, str]) -> str:
+        """Generate a single site from a (slug, product_prompt) pair."""
+        slug, product_prompt = item
+        generate_site(slug, product_prompt, project_root, config, debug=debug)
+        return slug
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        return list(executor.map(_generate, items))
+
+
 def refine_site(slug: str, feedback: str, project_root: Path, config: Config, *, debug: bool = False) -> None:
     """Refine an existing landing page using Gemini CLI."""
     prompts_dir = project_root / "prompts"
     template_path = prompts_dir / "refine_landing_prompt.md"
-    if not template_path.exists():
-        raise FileNotFoundError(f"Refine prompt template not found at {template_path}")
+    try:
+        template = _read_template(template_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Refine prompt template not found at {template_path}") from None
 
     site_dir = normalize_site_dir(slug, project_root)
     if not site_dir.exists():
         raise FileNotFoundError(f"Site directory not found: {site_dir}")
 
-    template = template_path.read_text(encoding="utf-8")
-    text = (
-        template
-        .replace("{{ slug }}", slug)
-        .replace("{{ feedback }}", feedback)
+    text = _render_template(
+        template,
+        {
+            "slug": slug,
+            "feedback": feedback,
+        },
     )
 
     _run_gemini(text, config.gemini_code_model, config, cwd=site_dir, debug=debug)
@@ -0,0 +1,19 @@
+"""HTTP helpers shared by the Cloudflare and Gemini image clients."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from urllib3.util.retry import Retry
+
+# Longest wait honoured from a server's Retry-After header before retrying.
+RETRY_AFTER_MAX_SECONDS = 10
+
+
+class CappedRetry(Retry):
+    """Retry policy that never sleeps longer than RETRY_AFTER_MAX_SECONDS for a Retry-After header."""
+
+    def get_retry_after(self, response: Any) -> float | None:
+        """Return the server's Retry-After delay, capped."""
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX_SECONDS)
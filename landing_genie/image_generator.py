@@ -3,26 +3,58 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import json
 import hashlib
 import importlib.resources as resources
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
 from typing import Iterable, TypedDict, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from . import gemini_runner
 from .config import Config
-from .site_paths import normalize_site_dir
+from .http_utils import CappedRetry
+from .site_paths import cache_dir, normalize_site_dir
+from .text_utils import strip_code_fences
 
 
 _API_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
-
-
-@dataclass
+_FILES_UPLOAD_URL = "https://generativelanguage.googleapis.com/upload/v1beta/files"
+_FILES_CACHE_NAME = "gemini-files.json"
+# The Files API keeps uploads for 48 hours; stop reusing them a little earlier.
+_FILES_CACHE_TTL_SECONDS = 47 * 60 * 60
+# Serializes reads, uploads and rewrites of the uploads cache across image worker threads.
+_FILES_CACHE_LOCK = threading.Lock()
+# Error bodies that blame the fileData reference (expired, deleted or foreign uploads).
+_FILE_REFERENCE_ERROR_RE = re.compile(r"\bfile|\buri\b", re.IGNORECASE)
+# Generation calls are POSTs, so only retry when the request never reached the model:
+# connection failures and explicit 429/503 refusals, never read timeouts. A Retry-After
+# is honoured but capped so a busy model cannot park the worker threads for minutes.
+_RETRY = CappedRetry(
+    total=2,
+    connect=2,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+
+
+@dataclass(frozen=True)
 class ImageSlot:
     """Image slot metadata extracted from site HTML."""
     src: str
@@ -50,8 +82,15 @@ class _ImgParser(HTMLParser):
 
 def _discover_image_slots(index_path: Path) -> list[ImageSlot]:
     """Parse an index file and return unique image slots."""
+    stat = index_path.stat()
+    return list(_parse_image_slots(str(index_path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _parse_image_slots(path_str: str, mtime_ns: int, size: int) -> tuple[ImageSlot, ...]:
+    """Parse image slots once per file version; prompts and generation both scan the same index."""
     parser = _ImgParser()
-    parser.feed(index_path.read_text(encoding="utf-8"))
+    parser.feed(Path(path_str).read_text(encoding="utf-8"))
 
     seen: set[str] = set()
     unique: list[ImageSlot] = []
@@ -60,7 +99,7 @@ def _discover_image_slots(index_path: Path) -> list[ImageSlot]:
             continue
         seen.add(slot.src)
         unique.append(slot)
-    return unique
+    return tuple(unique)
 
 
 _ASSET_PATTERN = re.compile(r"assets/[A-Za-z0-9._/-]+")
@@ -76,14 +115,15 @@ def _discover_asset_paths(site_dir: Path) -> set[str]:
     """Find all asset file references (HTML, CSS, JS) under the site dir."""
     assets: set[str] = set()
     for name in ("index.html", "styles.css", "main.js"):
-        path = site_dir / name
-        if not path.exists():
+        try:
+            text = (site_dir / name).read_text(encoding="utf-8", errors="ignore")
+        except FileNotFoundError:
             continue
-        text = path.read_text(encoding="utf-8", errors="ignore")
         assets.update(_ASSET_PATTERN.findall(text))
     return assets
 
 
+@lru_cache(maxsize=None)
 def _placeholder_bytes(ext: str) -> bytes:
     """Load bundled placeholder bytes for a given extension."""
     filename = 'placeholder.jpg' if ext in {'.jpg', '.jpeg'} else 'placeholder.png'
@@ -91,12 +131,15 @@ def _placeholder_bytes(ext: str) -> bytes:
 
 
 def _hash_file(path: Path) -> str:
-    """Hash a file with SHA-256."""
-    digest = hashlib.sha256()
+    """Hash a file with SHA-256, streaming it through hashlib's C read loop."""
     with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+# Upper bound on concurrent Gemini CLI processes when filling in per-slot prompts.
+IMAGE_PROMPT_MAX_CONCURRENCY = 4
+# Upper bound on concurrent image generation requests per site.
+IMAGE_GENERATION_MAX_CONCURRENCY = 4
 
 
 def _resolve_image_prompt_for_slot(
@@ -109,8 +152,6 @@ def _resolve_image_prompt_for_slot(
     debug: bool = False,
 ) -> str:
     """Generate a prompt for a single image slot via Gemini."""
-    from . import gemini_runner  # Local import to avoid circular dependency.
-
     return gemini_runner.generate_image_prompt(
         slot_src=slot.src,
         slot_alt=slot.alt,
@@ -160,9 +201,15 @@ class _InlineDataPayload(TypedDict):
     data: str
 
 
+class _FileDataPayload(TypedDict):
+    mimeType: str
+    fileUri: str
+
+
 class _PartPayload(TypedDict, total=False):
     text: str
     inlineData: _InlineDataPayload
+    fileData: _FileDataPayload
 
 
 class _ContentPayload(TypedDict):
@@ -170,22 +217,19 @@ class _ContentPayload(TypedDict):
     parts: list[_PartPayload]
 
 
-def _guess_image_mime_type(path: Path) -> str:
-    """Return a best-effort MIME type for an image path."""
-    return {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-        ".gif": "image/gif",
-        ".avif": "image/avif",
-    }.get(path.suffix.lower(), "image/png")
+_IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".avif": "image/avif",
+}
 
 
-def _strip_code_fences(text: str) -> str:
-    """Remove Markdown code fences around text."""
-    match = re.match(r"\s*```(?:json)?\s*(.*?)\s*```\s*$", text, flags=re.DOTALL | re.IGNORECASE)
-    return match.group(1) if match else text.strip()
+def _guess_image_mime_type(path: Path) -> str:
+    """Return a best-effort MIME type for an image path."""
+    return _IMAGE_MIME_TYPES.get(path.suffix.lower(), "image/png")
 
 
 def _format_reference_prompt(prompt: str, canonical_description: str | None) -> str:
@@ -236,6 +280,133 @@ def _log_image_usage(usage: _UsageMetadata | None, config: Config, *, label: str
     print(message)
 
 
+def _load_files_cache(cache_path: Path) -> dict[str, dict[str, object]]:
+    """Load the sha256 -> uploaded file mapping, ignoring missing or corrupt caches."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return cast(dict[str, dict[str, object]], data)
+
+
+def _upload_gemini_file(data: bytes, mime_type: str, api_key: str) -> str:
+    """Upload bytes to the Gemini Files API and return the file URI."""
+    start = _SESSION.post(
+        _FILES_UPLOAD_URL,
+        params={"key": api_key},
+        headers={
+            "X-Goog-Upload-Protocol": "resumable",
+            "X-Goog-Upload-Command": "start",
+            "X-Goog-Upload-Header-Content-Length": str(len(data)),
+            "X-Goog-Upload-Header-Content-Type": mime_type,
+        },
+        json={"file": {"display_name": "landing-genie-reference"}},
+        timeout=60,
+    )
+    upload_url = start.headers.get("X-Goog-Upload-URL")
+    if start.status_code != 200 or not upload_url:
+        raise RuntimeError(f"Gemini file upload could not start: {start.status_code} {start.text}")
+
+    resp = _SESSION.post(
+        upload_url,
+        headers={
+            "X-Goog-Upload-Offset": "0",
+            "X-Goog-Upload-Command": "upload, finalize",
+        },
+        data=data,
+        timeout=120,
+    )
+    if resp.status_code != 200:
+        raise RuntimeError(f"Gemini file upload failed: {resp.status_code} {resp.text}")
+    try:
+        return str(resp.json()["file"]["uri"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise RuntimeError(f"Unexpected Gemini file upload response: {resp.text}") from exc
+
+
+def _files_cache_key(data: bytes, api_key: str) -> str:
+    """Key uploads by API key as well as content; a file URI only works for the project that uploaded it."""
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return f"{key_hash}:{hashlib.sha256(data).hexdigest()}"
+
+
+def _write_files_cache(cache_path: Path, cache: dict[str, dict[str, object]]) -> None:
+    """Replace the uploads cache atomically so concurrent readers never see a partial file."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _forget_reference_file_uri(data: bytes, api_key: str, cache_path: Path) -> None:
+    """Drop a cached upload that Gemini rejected so the next run uploads it again."""
+    with _FILES_CACHE_LOCK:
+        cache = _load_files_cache(cache_path)
+        if cache.pop(_files_cache_key(data, api_key), None) is not None:
+            _write_files_cache(cache_path, cache)
+
+
+def _reference_file_uri(data: bytes, mime_type: str, api_key: str, cache_path: Path) -> str | None:
+    """
+    Return a Files API URI for reference bytes, uploading only when no fresh upload is cached.
+
+    Returns None when the upload fails so callers can fall back to inline data.
+    """
+    digest = _files_cache_key(data, api_key)
+    # Held across the upload so concurrent callers with the same bytes wait for one upload.
+    with _FILES_CACHE_LOCK:
+        cache = _load_files_cache(cache_path)
+        entry = cache.get(digest)
+        if isinstance(entry, dict):
+            uri = entry.get("uri")
+            uploaded_at = entry.get("uploaded_at")
+            if (
+                isinstance(uri, str)
+                and isinstance(uploaded_at, (int, float))
+                and time.time() - uploaded_at < _FILES_CACHE_TTL_SECONDS
+            ):
+                return uri
+
+        try:
+            uri = _upload_gemini_file(data, mime_type, api_key)
+        except Exception as exc:
+            print(f"[Gemini Images] Reference upload failed; sending image inline instead. ({exc})")
+            return None
+
+        now = time.time()
+        cache = {
+            key: value
+            for key, value in cache.items()
+            if isinstance(value.get("uploaded_at"), (int, float))
+            and now - cast(float, value["uploaded_at"]) < _FILES_CACHE_TTL_SECONDS
+        }
+        cache[digest] = {"uri": uri, "uploaded_at": now}
+        _write_files_cache(cache_path, cache)
+        return uri
+
+
+def _inline_image_part(data: bytes, mime_type: str) -> _PartPayload:
+    """Build an inlineData request part for image bytes."""
+    return {"inlineData": {"mimeType": mime_type, "data": base64.b64encode(data).decode("ascii")}}
+
+
+def _is_file_reference_error(resp: requests.Response) -> bool:
+    """
+    Return True if a failed generation request points at the fileData reference.
+
+    Other 4xx responses (prompt or safety rejections) are not retried inline, since a
+    second generation call would be billed for the same failure.
+    """
+    if resp.status_code == 404:
+        return True
+    return resp.status_code in (400, 403) and _FILE_REFERENCE_ERROR_RE.search(resp.text or "") is not None
+
+
 def _request_image(
     prompt: str,
     model: str,
@@ -243,34 +414,58 @@ def _request_image(
     *,
     reference_image: bytes | None = None,
     reference_mime_type: str | None = None,
+    reference_cache_path: Path | None = None,
+    reference_file_uri: str | None = None,
 ) -> tuple[bytes, _UsageMetadata | None]:
-    """Request an image from Gemini for the provided prompt."""
+    """
+    Request an image from Gemini for the provided prompt.
+
+    When reference_cache_path is set, the reference image is sent as a Files API
+    reference (uploaded once and reused across calls/runs) instead of inline bytes.
+    Callers that already resolved the upload pass it as reference_file_uri.
+    """
     # Use responseModalities for the Gemini 3 image models (responseMimeType is rejected with
     # INVALID_ARGUMENT on those preview endpoints).
     generation_config: _GenerationConfig = {"responseModalities": ["IMAGE"]}
 
     parts: list[_PartPayload] = []
+    file_uri = reference_file_uri
     if reference_image is not None:
         mime_type = reference_mime_type or "image/png"
-        parts.append(
-            {
-                "inlineData": {
-                    "mimeType": mime_type,
-                    "data": base64.b64encode(reference_image).decode("ascii"),
-                }
-            }
-        )
+        if file_uri is None and reference_cache_path is not None:
+            file_uri = _reference_file_uri(reference_image, mime_type, api_key, reference_cache_path)
+        if file_uri:
+            parts.append({"fileData": {"mimeType": mime_type, "fileUri": file_uri}})
+        else:
+            parts.append(_inline_image_part(reference_image, mime_type))
     parts.append({"text": prompt})
 
-    contents: list[_ContentPayload] = [{"role": "user", "parts": parts}]
-    payload: dict[str, object] = {"contents": contents, "generationConfig": generation_config}
+    def _post() -> requests.Response:
+        """Send the generation request with the current parts."""
+        contents: list[_ContentPayload] = [{"role": "user", "parts": parts}]
+        payload: dict[str, object] = {"contents": contents, "generationConfig": generation_config}
+        return _SESSION.post(
+            _API_URL.format(model=model),
+            params={"key": api_key},
+            json=payload,
+            timeout=120,
+        )
 
-    resp = requests.post(
-        _API_URL.format(model=model),
-        params={"key": api_key},
-        json=payload,
-        timeout=120,
-    )
+    resp = _post()
+    if (
+        file_uri
+        and reference_image is not None
+        and reference_cache_path is not None
+        and _is_file_reference_error(resp)
+    ):
+        # The cached upload may have expired early, been deleted, or belong to another project.
+        print(
+            f"[Gemini Images] Reference file was rejected ({resp.status_code}); "
+            "retrying with the image inline."
+        )
+        _forget_reference_file_uri(reference_image, api_key, reference_cache_path)
+        parts[0] = _inline_image_part(reference_image, reference_mime_type or "image/png")
+        resp = _post()
     if resp.status_code != 200:
         raise RuntimeError(f"Gemini image request failed: {resp.status_code} {resp.text}")
 
@@ -288,7 +483,8 @@ def _request_image(
         raise RuntimeError(f"Unexpected Gemini image response: {data}") from exc
 
     usage = data.get("usageMetadata")
-    return base64.b64decode(image_b64), usage
+    # a2b_base64 takes the ASCII str directly; b64decode would first copy it into bytes.
+    return binascii.a2b_base64(image_b64), usage
 
 
 def _request_text_with_image(
@@ -315,7 +511,7 @@ def _request_text_with_image(
     contents: list[_ContentPayload] = [{"role": "user", "parts": parts}]
     payload: dict[str, object] = {"contents": contents, "generationConfig": generation_config}
 
-    resp = requests.post(
+    resp = _SESSION.post(
         _API_URL.format(model=model),
         params={"key": api_key},
         json=payload,
@@ -346,7 +542,7 @@ def _request_text_with_image(
 
 def _extract_description(text: str) -> str:
     """Extract a description field from JSON-like output."""
-    stripped = _strip_code_fences(text)
+    stripped = strip_code_fences(text)
     try:
         data_obj = json.loads(stripped)
     except json.JSONDecodeError:
@@ -393,14 +589,13 @@ def ensure_placeholder_assets(slug: str, project_root: Path) -> list[Path]:
     created: list[Path] = []
     for rel_path in assets:
         path = site_dir / rel_path
-        if path.exists():
-            try:
-                # Gemini sometimes leaves zero-byte placeholder files; treat them as missing.
-                if path.stat().st_size > 0:
-                    continue
-            except OSError:
-                # If we cannot stat the file, fall back to recreating it as a placeholder.
-                pass
+        try:
+            # Gemini sometimes leaves zero-byte placeholder files; treat them as missing.
+            if path.stat().st_size > 0:
+                continue
+        except OSError:
+            # Missing or unreadable: (re)create it as a placeholder.
+            pass
         path.parent.mkdir(parents=True, exist_ok=True)
         ext = path.suffix.lower()
         data = _placeholder_bytes(ext)
@@ -418,19 +613,24 @@ def _is_placeholder_asset(path: Path) -> bool:
     """
     ext = path.suffix.lower()
     try:
-        if path.stat().st_size == 0:
-            return True
+        size = path.stat().st_size
     except OSError:
         return False
+    if size == 0:
+        return True
+    # Placeholders have a fixed size, so any other size rules the asset out without hashing it.
+    if size != len(_placeholder_bytes(ext)):
+        return False
     expected_hash = _PLACEHOLDER_HASHES.get(ext)
     if expected_hash:
         try:
             return _hash_file(path) == expected_hash
         except OSError:
             return False
-    # Fallback for unexpected suffixes: compare to bundled placeholder bytes.
+    # Fallback for unexpected suffixes: compare a streamed hash to the bundled placeholder
+    # so large assets are never read fully into memory.
     try:
-        return path.read_bytes() == _placeholder_bytes(ext)
+        return _hash_file(path) == hashlib.sha256(_placeholder_bytes(ext)).hexdigest()
     except Exception:
         return False
 
@@ -464,8 +664,6 @@ def generate_image_prompts_for_site(
         return Path(slot.src).stem.replace("-", " ").replace("_", " ")
 
     slots_payload = [{"src": slot.src, "alt": _slot_alt(slot)} for slot in slots]
-    from . import gemini_runner  # Local import to avoid circular dependency.
-
     prompts_map = gemini_runner.generate_image_prompts_batch(
         slots_payload,
         product_prompt,
@@ -475,21 +673,25 @@ def generate_image_prompts_for_site(
         debug=debug,
     )
 
-    prompts: list[tuple[str, str]] = []
-    for slot in slots:
-        prompt_text = prompts_map.get(slot.src)
-        if not prompt_text:
-            prompt_text = _resolve_image_prompt_for_slot(
-                slot,
-                product_prompt,
-                project_root,
-                config,
-                image_follow_up_context=image_follow_up_context,
-                debug=debug,
+    # Slots the batch call missed each need their own CLI run; they are independent,
+    # so run them side by side instead of paying one full Gemini round-trip per slot.
+    missing = [slot for slot in slots if not prompts_map.get(slot.src)]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(IMAGE_PROMPT_MAX_CONCURRENCY, len(missing))) as executor:
+            resolved = executor.map(
+                lambda slot: _resolve_image_prompt_for_slot(
+                    slot,
+                    product_prompt,
+                    project_root,
+                    config,
+                    image_follow_up_context=image_follow_up_context,
+                    debug=debug,
+                ),
+                missing,
             )
-        prompts.append((slot.src, prompt_text))
+            prompts_map = {**prompts_map, **{slot.src: text for slot, text in zip(missing, resolved)}}
 
-    return prompts
+    return [(slot.src, prompts_map[slot.src]) for slot in slots]
 
 
 def generate_images_for_site(
@@ -547,8 +749,6 @@ def generate_images_for_site(
             prompts_map[slot.src] = prompt_text
         slots_payload.append({"src": slot.src, "alt": _slot_alt(slot), "prompt": prompt_text})
 
-    from . import gemini_runner  # Local import to avoid circular dependency.
-
     canonical_src, product_slots = gemini_runner.select_product_slots(
         slots_payload,
         product_prompt,
@@ -565,48 +765,14 @@ def generate_images_for_site(
     canonical_reference: bytes | None = None
     canonical_mime_type: str | None = None
     canonical_description: str | None = None
+    canonical_file_uri: str | None = None
+    files_cache_path = cache_dir(project_root) / _FILES_CACHE_NAME
 
-    generated: list[Path] = []
-    for idx, slot in enumerate(slots):
+    def _generate_slot(slot: ImageSlot, use_reference: bool) -> bytes:
+        """Request one slot's image and write it into the site."""
         target_path = site_dir / slot.src
-        existing = target_path.exists() and not overwrite and not _is_placeholder_asset(target_path)
-        if existing:
-            if canonical_src == slot.src and canonical_reference is None:
-                try:
-                    canonical_reference = target_path.read_bytes()
-                except OSError:
-                    canonical_reference = None
-                if canonical_reference is not None:
-                    canonical_mime_type = _guess_image_mime_type(target_path)
-                    canonical_description = _describe_canonical_product(
-                        canonical_reference,
-                        canonical_mime_type,
-                        project_root,
-                        config,
-                        api_key,
-                    )
-            continue
-
-        prompt_text = prompts_map.get(slot.src)
-        if not prompt_text:
-            prompt_text = _resolve_image_prompt_for_slot(
-                slot,
-                product_prompt,
-                project_root,
-                config,
-                image_follow_up_context=image_follow_up_context,
-                debug=debug,
-            )
-            prompts_map[slot.src] = prompt_text
-
-        should_use_reference = (
-            canonical_reference is not None
-            and canonical_index is not None
-            and idx > canonical_index
-            and slot.src in product_slots
-        )
-
-        if should_use_reference:
+        prompt_text = prompts_map[slot.src]
+        if use_reference:
             prompt_text = _format_reference_prompt(prompt_text, canonical_description)
             image_bytes, usage = _request_image(
                 prompt_text,
@@ -614,6 +780,8 @@ def generate_images_for_site(
                 api_key,
                 reference_image=canonical_reference,
                 reference_mime_type=canonical_mime_type,
+                reference_cache_path=files_cache_path,
+                reference_file_uri=canonical_file_uri,
             )
         else:
             image_bytes, usage = _request_image(prompt_text, config.gemini_image_model, api_key)
@@ -621,17 +789,64 @@ def generate_images_for_site(
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_bytes(image_bytes)
         _log_image_usage(usage, config)
-        generated.append(target_path)
-
-        if canonical_src == slot.src:
-            canonical_reference = image_bytes
-            canonical_mime_type = _guess_image_mime_type(target_path)
-            canonical_description = _describe_canonical_product(
-                canonical_reference,
-                canonical_mime_type,
-                project_root,
-                config,
-                api_key,
-            )
+        return image_bytes
+
+    pending: list[tuple[int, ImageSlot]] = []
+    for idx, slot in enumerate(slots):
+        target_path = site_dir / slot.src
+        existing = target_path.exists() and not overwrite and not _is_placeholder_asset(target_path)
+        if not existing:
+            pending.append((idx, slot))
+        elif canonical_src == slot.src:
+            try:
+                canonical_reference = target_path.read_bytes()
+            except OSError:
+                canonical_reference = None
+
+    generated = [site_dir / slot.src for _idx, slot in pending]
+
+    # The canonical image is the reference for later product slots, so it is generated
+    # (or described) before the rest; the remaining slots are independent requests.
+    if canonical_index is not None and any(idx == canonical_index for idx, _slot in pending):
+        canonical_reference = _generate_slot(slots[canonical_index], use_reference=False)
+        pending = [(idx, slot) for idx, slot in pending if idx != canonical_index]
+    if canonical_reference is not None and canonical_index is not None:
+        canonical_mime_type = _guess_image_mime_type(site_dir / slots[canonical_index].src)
+        canonical_description = _describe_canonical_product(
+            canonical_reference,
+            canonical_mime_type,
+            project_root,
+            config,
+            api_key,
+        )
+
+    uses_reference = [
+        canonical_reference is not None
+        and canonical_index is not None
+        and idx > canonical_index
+        and slot.src in product_slots
+        for idx, slot in pending
+    ]
+    if canonical_reference is not None and any(uses_reference):
+        # Upload once here rather than letting every worker race on the uploads cache.
+        canonical_file_uri = _reference_file_uri(
+            canonical_reference,
+            canonical_mime_type or "image/png",
+            api_key,
+            files_cache_path,
+        )
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(IMAGE_GENERATION_MAX_CONCURRENCY, len(pending))) as executor:
+            futures = [
+                executor.submit(_generate_slot, slot, use_reference)
+                for (_idx, slot), use_reference in zip(pending, uses_reference)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
     return generated
@@ -6,6 +6,7 @@ import http.server
 import json
 import re
 import socketserver
+import time
 from dataclasses import dataclass
 from http import HTTPStatus
 from pathlib import Path
@@ -32,9 +33,17 @@ class _ServerState:
     project_root: Path
     config: Config | None
     port: int
+    # Live-reload counter, bumped only once a refinement has finished writing the site.
+    version: int = 0
+    # time.monotonic() of the latest live-reload poll; 0.0 when no tab has polled yet.
+    last_polled: float = 0.0
 
 
+# An open preview tab polls the version every second; a tab silent for longer is treated as closed.
+PREVIEW_CLIENT_TIMEOUT_SECONDS = 5.0
+
 _SERVERS: dict[int, _ServerState] = {}
+_BODY_CLOSE_RE = re.compile(r"</body\s*>", re.IGNORECASE)
 
 
 class ReusableTCPServer(socketserver.TCPServer):
@@ -216,6 +225,25 @@ def _inject_preview_layer(html: str) -> str:
 
   gatherPreviewables();
 
+  // Reload when the server reports a finished refinement (e.g. after CLI feedback runs).
+  let knownVersion = null;
+  async function pollVersion() {
+    try {
+      const response = await fetch("/__preview/version", { cache: "no-store" });
+      const data = await response.json();
+      if (knownVersion === null) {
+        knownVersion = data.version;
+      } else if (data.version !== knownVersion && !modal.root.classList.contains("lg-open")) {
+        window.location.reload();
+        return;
+      }
+    } catch (error) {
+      // Server restarting or briefly unavailable; keep polling.
+    }
+    setTimeout(pollVersion, 1000);
+  }
+  pollVersion();
+
   async function sendRefinement(payload) {
     const response = await fetch("/__preview/refine", {
       method: "POST",
@@ -266,12 +294,30 @@ def _inject_preview_layer(html: str) -> str:
 })();
 </script>
 """
-    match = re.search(r"</body\s*>", html, flags=re.IGNORECASE)
+    match = _BODY_CLOSE_RE.search(html)
     if match:
         return html[: match.start()] + overlay + html[match.start() :]
     return html + overlay
 
 
+def reload_previews(slug: str, project_root: Path) -> bool:
+    """
+    Tell open preview tabs for a site to reload after its files were rewritten.
+
+    Returns True if a tab polled within PREVIEW_CLIENT_TIMEOUT_SECONDS, i.e. someone
+    will see the update without the caller opening a browser again.
+    """
+    site_dir = normalize_site_dir(slug, project_root)
+    now = time.monotonic()
+    watched = False
+    for state in _SERVERS.values():
+        if normalize_site_dir(state.slug, state.project_root) != site_dir:
+            continue
+        state.version += 1
+        watched = watched or (state.last_polled > 0 and now - state.last_polled < PREVIEW_CLIENT_TIMEOUT_SECONDS)
+    return watched
+
+
 def _build_feedback(section_label: str, section_text: str, instruction: str) -> str:
     """Format a refinement instruction for Gemini."""
     text = (section_text or "").strip()
@@ -371,8 +417,16 @@ def serve_local(
             return super().do_HEAD()
 
         def do_GET(self) -> None:
-            """Handle GET requests for HTML or static assets."""
+            """Handle GET requests for HTML, static assets, or the live-reload version."""
             parsed = urlparse(self.path)
+            if parsed.path == "/__preview/version":
+                state = _SERVERS.get(self.server.server_address[1])
+                version = 0
+                if state is not None:
+                    state.last_polled = time.monotonic()
+                    version = state.version
+                self._json_response(HTTPStatus.OK, {"version": version})
+                return
             if parsed.path.endswith(".html") or parsed.path in {"/", ""}:
                 return self._serve_html(write_body=True)
             return super().do_GET()
@@ -409,6 +463,7 @@ def serve_local(
                 active_config = config or Config.load()
                 refine_site(slug=slug, feedback=feedback, project_root=project_root, config=active_config, debug=debug)
                 ensure_placeholder_assets(slug=slug, project_root=project_root)
+                reload_previews(slug, project_root)
             except Exception as exc:  # noqa: BLE001
                 if debug:
                     print(f"[preview] Refinement failed: {exc}")
@@ -7,6 +7,7 @@ import shutil
 from pathlib import Path
 
 _SLUG_PATTERN = re.compile(r"^[a-z0-9-]+$")
+CACHE_DIR_NAME = ".landing-genie"
 
 
 def normalize_slug(raw_slug: str) -> str:
@@ -54,3 +55,8 @@ def normalize_site_dir(slug: str, project_root: Path) -> Path:
                 pass
 
     return site_dir
+
+
+def cache_dir(project_root: Path) -> Path:
+    """Return the directory holding landing-genie's local caches (not created)."""
+    return project_root / CACHE_DIR_NAME
@@ -0,0 +1,19 @@
+"""Text helpers shared by the Gemini CLI and image modules."""
+
+from __future__ import annotations
+
+import re
+
+_CODE_FENCE_RE = re.compile(r"\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL | re.IGNORECASE)
+
+
+def strip_code_fences(text: str) -> str:
+    """
+    Remove surrounding Markdown fences such as ```json ... ``` or ``` ... ```.
+    """
+    stripped = text.strip()
+    # A fenced block must open and close with ```; skip the regex for everything else.
+    if not (stripped.startswith("```") and stripped.endswith("```")):
+        return stripped
+    match = _CODE_FENCE_RE.match(text)
+    return match.group(1) if match else stripped
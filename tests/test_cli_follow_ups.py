@@ -2,6 +2,7 @@
 
 from typer.testing import CliRunner
 
+from dataclasses import replace
 from types import SimpleNamespace
 from pathlib import Path
 
@@ -9,21 +10,28 @@ from landing_genie import cli, gemini_runner
 from landing_genie.config import Config
 
 
-def test_new_skips_followups_when_flag_disabled(monkeypatch, tmp_path) -> None:
-    """Ensure --no-follow-ups bypasses question fetching."""
-    runner = CliRunner()
-    dummy_config = Config(
+def _test_config() -> Config:
+    """Build a minimal Config for CLI tests."""
+    return Config(
         root_domain="example.com",
         cf_account_id="acc",
         cf_api_token="token",
+        lead_to_email=None,
         gemini_code_model="gemini-2.5-pro",
         gemini_image_model="gemini-2.5-flash-image",
         gemini_cli_command="gemini",
         gemini_api_key=None,
         gemini_telemetry_otlp_endpoint=None,
         gemini_image_cost_per_1k_tokens=None,
+        gemini_image_input_cost_per_1k_tokens=None,
     )
 
+
+def test_new_skips_followups_when_flag_disabled(monkeypatch, tmp_path) -> None:
+    """Ensure --no-follow-ups bypasses question fetching."""
+    runner = CliRunner()
+    dummy_config = _test_config()
+
     monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls: dummy_config))
     monkeypatch.setattr(cli, "_project_root", lambda: tmp_path)
 
@@ -67,17 +75,7 @@ def test_new_skips_followups_when_flag_disabled(monkeypatch, tmp_path) -> None:
 def test_new_generates_image_prompts_when_images_disabled(monkeypatch, tmp_path) -> None:
     """Ensure image prompts are generated when images are disabled."""
     runner = CliRunner()
-    dummy_config = Config(
-        root_domain="example.com",
-        cf_account_id="acc",
-        cf_api_token="token",
-        gemini_code_model="gemini-2.5-flash",
-        gemini_image_model="gemini-2.5-flash-image",
-        gemini_cli_command="gemini",
-        gemini_api_key=None,
-        gemini_telemetry_otlp_endpoint=None,
-        gemini_image_cost_per_1k_tokens=None,
-    )
+    dummy_config = replace(_test_config(), gemini_code_model="gemini-2.5-flash")
 
     monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls: dummy_config))
     monkeypatch.setattr(cli, "_project_root", lambda: tmp_path)
@@ -129,17 +127,7 @@ def test_new_generates_image_prompts_when_images_disabled(monkeypatch, tmp_path)
 def test_new_logs_prompts_and_overwrites(monkeypatch, tmp_path) -> None:
     """Ensure prompt logs append across CLI runs."""
     runner = CliRunner()
-    dummy_config = Config(
-        root_domain="example.com",
-        cf_account_id="acc",
-        cf_api_token="token",
-        gemini_code_model="gemini-2.5-pro",
-        gemini_image_model="gemini-2.5-flash-image",
-        gemini_cli_command="gemini",
-        gemini_api_key=None,
-        gemini_telemetry_otlp_endpoint=None,
-        gemini_image_cost_per_1k_tokens=None,
-    )
+    dummy_config = _test_config()
 
     monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls: dummy_config))
     monkeypatch.setattr(cli, "_project_root", lambda: tmp_path)
@@ -193,17 +181,7 @@ def test_new_logs_prompts_and_overwrites(monkeypatch, tmp_path) -> None:
 def test_prompt_log_respects_cap(monkeypatch, tmp_path) -> None:
     """Ensure prompt log size cap is enforced."""
     runner = CliRunner()
-    dummy_config = Config(
-        root_domain="example.com",
-        cf_account_id="acc",
-        cf_api_token="token",
-        gemini_code_model="gemini-2.5-pro",
-        gemini_image_model="gemini-2.5-flash-image",
-        gemini_cli_command="gemini",
-        gemini_api_key=None,
-        gemini_telemetry_otlp_endpoint=None,
-        gemini_image_cost_per_1k_tokens=None,
-    )
+    dummy_config = _test_config()
 
     monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls: dummy_config))
     monkeypatch.setattr(cli, "_project_root", lambda: tmp_path)
@@ -255,17 +233,7 @@ def test_prompt_log_respects_cap(monkeypatch, tmp_path) -> None:
 
 def test_image_prompt_generation_logs_result(monkeypatch, tmp_path) -> None:
     """Ensure image prompt results are logged."""
-    dummy_config = Config(
-        root_domain="example.com",
-        cf_account_id="acc",
-        cf_api_token="token",
-        gemini_code_model="gemini-2.5-pro",
-        gemini_image_model="gemini-2.5-flash-image",
-        gemini_cli_command="gemini",
-        gemini_api_key=None,
-        gemini_telemetry_otlp_endpoint=None,
-        gemini_image_cost_per_1k_tokens=None,
-    )
+    dummy_config = _test_config()
 
     prompts_dir = tmp_path / "prompts"
     prompts_dir.mkdir(parents=True, exist_ok=True)
@@ -300,17 +268,7 @@ def test_image_prompt_generation_logs_result(monkeypatch, tmp_path) -> None:
 
 def test_batch_image_prompts(monkeypatch, tmp_path) -> None:
     """Ensure batch image prompt generation returns prompts and logs them."""
-    dummy_config = Config(
-        root_domain="example.com",
-        cf_account_id="acc",
-        cf_api_token="token",
-        gemini_code_model="gemini-2.5-pro",
-        gemini_image_model="gemini-2.5-flash-image",
-        gemini_cli_command="gemini",
-        gemini_api_key=None,
-        gemini_telemetry_otlp_endpoint=None,
-        gemini_image_cost_per_1k_tokens=None,
-    )
+    dummy_config = _test_config()
 
     prompts_dir = tmp_path / "prompts"
     prompts_dir.mkdir(parents=True, exist_ok=True)
@@ -342,3 +300,224 @@ def test_batch_image_prompts(monkeypatch, tmp_path) -> None:
     content = (tmp_path / ".log" / "gemini_prompts.log").read_text(encoding="utf-8")
     assert "image-prompt result" in content
     assert "assets/hero.png" in content and "p1" in content
+
+
+def test_cached_questions_reuses_disk_cache(monkeypatch, tmp_path) -> None:
+    """Ensure follow-up questions are served from disk for an identical prompt/model."""
+    monkeypatch.delenv(cli.GEMINI_CACHE_TTL_ENV_VAR, raising=False)
+    calls: list[str] = []
+
+    def _fetch() -> list[str]:
+        """Record Gemini calls and return fixed questions."""
+        calls.append("fetch")
+        return ["Who is the audience?"]
+
+    first = cli._cached_questions(tmp_path, "follow-up", ["prompt", "model"], _fetch)
+    second = cli._cached_questions(tmp_path, "follow-up", ["prompt", "model"], _fetch)
+    other_model = cli._cached_questions(tmp_path, "follow-up", ["prompt", "other-model"], _fetch)
+
+    assert first == second == other_model == ["Who is the audience?"]
+    assert len(calls) == 2
+
+    monkeypatch.setenv(cli.GEMINI_CACHE_TTL_ENV_VAR, "0")
+    cli._cached_questions(tmp_path, "follow-up", ["prompt", "model"], _fetch)
+    assert len(calls) == 3
+
+
+def test_cached_follow_up_pair_shares_entries_with_separate_fetches(monkeypatch, tmp_path) -> None:
+    """Ensure the combined fetch runs once and its results serve the separate lookups."""
+    monkeypatch.delenv(cli.GEMINI_CACHE_TTL_ENV_VAR, raising=False)
+    calls: list[str] = []
+
+    def _fetch_pair() -> tuple[list[str], list[str]]:
+        """Record combined Gemini calls and return fixed questions."""
+        calls.append("pair")
+        return ["Who is the audience?"], ["What mood?"]
+
+    def _fail_fetch() -> list[str]:
+        """Fail if a separate fetch runs despite a cached combined result."""
+        raise AssertionError("separate fetch should be served from cache")
+
+    first = cli._cached_follow_up_pair(tmp_path, ["prompt", "model"], _fetch_pair)
+    second = cli._cached_follow_up_pair(tmp_path, ["prompt", "model"], _fetch_pair)
+
+    assert first == second == (["Who is the audience?"], ["What mood?"])
+    assert calls == ["pair"]
+    assert cli._cached_questions(tmp_path, "follow-up", ["prompt", "model"], _fail_fetch) == ["Who is the audience?"]
+    assert cli._cached_questions(tmp_path, "image-follow-up", ["prompt", "model"], _fail_fetch) == ["What mood?"]
+
+    cli._cached_follow_up_pair(tmp_path, ["prompt", "other-model"], _fetch_pair)
+    assert calls == ["pair", "pair"]
+
+
+def test_follow_up_cache_key_tracks_limits_and_templates(monkeypatch, tmp_path) -> None:
+    """Ensure changing question limits or a follow-up template changes the cache key."""
+    config = _test_config()
+    monkeypatch.setattr(cli, "MAX_FOLLOW_UP_QUESTIONS", 20, raising=False)
+    monkeypatch.setattr(cli, "MAX_IMAGE_FOLLOW_UP_QUESTIONS", 20, raising=False)
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    template_path = prompts_dir / "follow_up_questions_prompt.md"
+    template_path.write_text("Ask up to {{ max_follow_up_questions }} questions.", encoding="utf-8")
+
+    base = cli._follow_up_cache_key(tmp_path, "prompt", config)
+    assert cli._follow_up_cache_key(tmp_path, "prompt", config) == base
+
+    monkeypatch.setattr(cli, "MAX_FOLLOW_UP_QUESTIONS", 5)
+    fewer_text = cli._follow_up_cache_key(tmp_path, "prompt", config)
+    monkeypatch.setattr(cli, "MAX_FOLLOW_UP_QUESTIONS", 20)
+    monkeypatch.setattr(cli, "MAX_IMAGE_FOLLOW_UP_QUESTIONS", 5)
+    fewer_image = cli._follow_up_cache_key(tmp_path, "prompt", config)
+    monkeypatch.setattr(cli, "MAX_IMAGE_FOLLOW_UP_QUESTIONS", 20)
+    template_path.write_text("Ask at most {{ max_follow_up_questions }} questions.", encoding="utf-8")
+    edited_template = cli._follow_up_cache_key(tmp_path, "prompt", config)
+
+    assert len({tuple(base), tuple(fewer_text), tuple(fewer_image), tuple(edited_template)}) == 4
+
+
+def test_new_reuses_cached_follow_ups_until_template_changes(monkeypatch, tmp_path) -> None:
+    """Ensure `new` serves follow-ups from cache and refetches after a template edit."""
+    runner = CliRunner()
+    monkeypatch.delenv(cli.GEMINI_CACHE_TTL_ENV_VAR, raising=False)
+    monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls: _test_config()))
+    monkeypatch.setattr(cli, "_project_root", lambda: tmp_path)
+    monkeypatch.setattr(cli, "generate_site", lambda **_kwargs: None)
+    monkeypatch.setattr(cli, "ensure_placeholder_assets", lambda **_kwargs: [])
+    monkeypatch.setattr(cli, "generate_image_prompts_for_site", lambda **_kwargs: [])
+    monkeypatch.setattr(cli, "serve_local", lambda slug, project_root, config=None, debug=False: f"http://localhost/{slug}")
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    template_path = prompts_dir / "combined_follow_up_questions_prompt.md"
+    template_path.write_text("v1 {{ product_prompt }}", encoding="utf-8")
+    calls: list[str] = []
+
+    def _fake_suggest_all(**_kwargs):
+        """Record combined follow-up calls."""
+        calls.append("all")
+        return ["Who is the audience?"], ["What mood?"]
+
+    monkeypatch.setattr(cli, "suggest_all_follow_up_questions", _fake_suggest_all)
+
+    def _invoke() -> None:
+        """Run `new` and answer the two follow-up questions."""
+        result = runner.invoke(
+            cli.app,
+            ["new", "--prompt", "test prompt", "--suggested-subdomain", "sluggy", "--no-images", "--no-open-browser"],
+            input="\n\ny\n",
+        )
+        assert result.exit_code == 0, result.output
+
+    _invoke()
+    _invoke()
+    assert calls == ["all"]
+
+    template_path.write_text("v2 {{ product_prompt }}", encoding="utf-8")
+    _invoke()
+    assert calls == ["all", "all"]
+
+
+def _stub_new_command(monkeypatch, tmp_path, generated: list[dict], image_prompt_calls: list[dict]) -> None:
+    """Stub everything `new` calls except the follow-up question helpers."""
+    monkeypatch.setenv(cli.GEMINI_CACHE_TTL_ENV_VAR, "0")
+    monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls: _test_config()))
+    monkeypatch.setattr(cli, "_project_root", lambda: tmp_path)
+    monkeypatch.setattr(cli, "generate_site", lambda **kwargs: generated.append(kwargs))
+    monkeypatch.setattr(cli, "ensure_placeholder_assets", lambda **_kwargs: [])
+    monkeypatch.setattr(cli, "generate_image_prompts_for_site", lambda **kwargs: image_prompt_calls.append(kwargs) or [])
+    monkeypatch.setattr(cli, "serve_local", lambda slug, project_root, config=None, debug=False: f"http://localhost/{slug}")
+
+
+def _invoke_new_with_answers() -> str:
+    """Run `new` with both follow-up kinds enabled, answering each question once."""
+    result = CliRunner().invoke(
+        cli.app,
+        ["new", "--prompt", "test prompt", "--suggested-subdomain", "sluggy", "--no-images", "--no-open-browser"],
+        input="Founders\nMoody\ny\n",
+    )
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_new_fetches_text_and_image_follow_ups_together(monkeypatch, tmp_path) -> None:
+    """Ensure `new` uses one combined call and skips the separate follow-up calls."""
+    generated: list[dict] = []
+    image_prompt_calls: list[dict] = []
+    _stub_new_command(monkeypatch, tmp_path, generated, image_prompt_calls)
+    calls: list[str] = []
+
+    def _fake_suggest_all(**_kwargs):
+        """Return both question sets from one call."""
+        calls.append("all")
+        return ["Who is the audience?"], ["What mood?"]
+
+    def _fail_separate(**_kwargs):
+        """Fail if a separate follow-up call runs after a combined success."""
+        raise AssertionError("separate follow-up calls should be skipped")
+
+    monkeypatch.setattr(cli, "suggest_all_follow_up_questions", _fake_suggest_all)
+    monkeypatch.setattr(cli, "suggest_follow_up_questions", _fail_separate)
+    monkeypatch.setattr(cli, "suggest_image_follow_up_questions", _fail_separate)
+
+    output = _invoke_new_with_answers()
+
+    assert calls == ["all"]
+    assert "Q1 (out of 1): Who is the audience?" in output
+    assert "Image Q1 (out of 1): What mood?" in output
+    assert generated[0]["follow_up_context"] == "- Who is the audience? Answer: Founders"
+    assert image_prompt_calls[0]["image_follow_up_context"] == "- What mood? Answer: Moody"
+
+
+def test_new_falls_back_to_separate_follow_ups_when_combined_fails(monkeypatch, tmp_path) -> None:
+    """Ensure a failed combined call falls back to the separate text and image calls."""
+    generated: list[dict] = []
+    image_prompt_calls: list[dict] = []
+    _stub_new_command(monkeypatch, tmp_path, generated, image_prompt_calls)
+    calls: list[str] = []
+
+    def _failing_suggest_all(**_kwargs):
+        """Simulate a combined follow-up call that Gemini cannot answer."""
+        calls.append("all")
+        raise ValueError("no question lists")
+
+    def _fake_suggest_text(**_kwargs):
+        """Return text follow-ups from the separate call."""
+        calls.append("text")
+        return ["Who is the audience?"]
+
+    def _fake_suggest_image(**_kwargs):
+        """Return image follow-ups from the separate call."""
+        calls.append("image")
+        return ["What mood?"]
+
+    monkeypatch.setattr(cli, "suggest_all_follow_up_questions", _failing_suggest_all)
+    monkeypatch.setattr(cli, "suggest_follow_up_questions", _fake_suggest_text)
+    monkeypatch.setattr(cli, "suggest_image_follow_up_questions", _fake_suggest_image)
+
+    _invoke_new_with_answers()
+
+    assert calls == ["all", "text", "image"]
+    assert generated[0]["follow_up_context"] == "- Who is the audience? Answer: Founders"
+    assert image_prompt_calls[0]["image_follow_up_context"] == "- What mood? Answer: Moody"
+
+
+def test_new_skips_follow_up_cache_key_when_follow_ups_disabled(monkeypatch, tmp_path) -> None:
+    """Ensure --no-follow-ups never builds the cache key (no template reads)."""
+    monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls: _test_config()))
+    monkeypatch.setattr(cli, "_project_root", lambda: tmp_path)
+    monkeypatch.setattr(cli, "generate_site", lambda **_kwargs: None)
+    monkeypatch.setattr(cli, "ensure_placeholder_assets", lambda **_kwargs: [])
+    monkeypatch.setattr(cli, "generate_image_prompts_for_site", lambda **_kwargs: [])
+    monkeypatch.setattr(cli, "serve_local", lambda slug, project_root, config=None, debug=False: f"http://localhost/{slug}")
+
+    def _fail_cache_key(*_args, **_kwargs):
+        """Fail if the follow-up cache key is computed."""
+        raise AssertionError("cache key should not be built when follow-ups are disabled")
+
+    monkeypatch.setattr(cli, "_follow_up_cache_key", _fail_cache_key)
+
+    result = CliRunner().invoke(
+        cli.app,
+        ["new", "--prompt", "test prompt", "--suggested-subdomain", "sluggy", "--no-images", "--no-open-browser", "--no-follow-ups"],
+        input="y\n",
+    )
+    assert result.exit_code == 0, result.output
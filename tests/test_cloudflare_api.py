@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
+import os
+import sys
+from types import SimpleNamespace
 from typing import Any, Dict
 
 from pytest import MonkeyPatch
@@ -9,6 +13,7 @@ from pytest import MonkeyPatch
 from landing_genie import cloudflare_api
 from landing_genie.cloudflare_api import PRODUCTION_BRANCH, _ensure_pages_project  # pyright: ignore[reportPrivateUsage]
 from landing_genie.config import Config
+from landing_genie.http_utils import RETRY_AFTER_MAX_SECONDS
 
 
 def _config() -> Config:
@@ -17,12 +22,14 @@ def _config() -> Config:
         root_domain="example.com",
         cf_account_id="account",
         cf_api_token="token",
+        lead_to_email=None,
         gemini_code_model="code-model",
         gemini_image_model="image-model",
         gemini_cli_command="gemini",
         gemini_api_key="api-key",
         gemini_telemetry_otlp_endpoint=None,
         gemini_image_cost_per_1k_tokens=None,
+        gemini_image_input_cost_per_1k_tokens=None,
     )
 
 
@@ -51,7 +58,7 @@ def test_ensure_pages_project_skips_when_existing(monkeypatch: MonkeyPatch) -> N
         calls["post"] += 1
         return {}
 
-    monkeypatch.setattr(cloudflare_api.requests, "get", fake_get)
+    monkeypatch.setattr(cloudflare_api._SESSION, "get", fake_get)
     monkeypatch.setattr(cloudflare_api, "_request", fake_request)
 
     _ensure_pages_project("proj", _config())
@@ -85,7 +92,7 @@ def test_ensure_pages_project_creates_when_missing(monkeypatch: MonkeyPatch) ->
         calls["json"] = kwargs.get("json")
         return {"success": True}
 
-    monkeypatch.setattr(cloudflare_api.requests, "get", fake_get)
+    monkeypatch.setattr(cloudflare_api._SESSION, "get", fake_get)
     monkeypatch.setattr(cloudflare_api, "_request", fake_request)
 
     _ensure_pages_project("proj", _config())
@@ -96,3 +103,220 @@ def test_ensure_pages_project_creates_when_missing(monkeypatch: MonkeyPatch) ->
         "name": "proj",
         "production_branch": PRODUCTION_BRANCH,
     }
+
+
+def test_ensure_custom_domain_reuses_zone_lookup(monkeypatch: MonkeyPatch) -> None:
+    """Ensure the zone is looked up once and shared with the DNS record step."""
+    calls: list[tuple[str, str]] = []
+    zone_lookups: list[str] = []
+
+    def fake_find_zone_id(config: Config) -> str:
+        """Record zone lookups."""
+        zone_lookups.append(config.root_domain)
+        return "zone-1"
+
+    def fake_request(method: str, path: str, config: Config, **kwargs: Any) -> Any:
+        """Return canned domain and DNS responses."""
+        calls.append((method, path))
+        if path.endswith("/domains"):
+            return [{"name": "demo.example.com", "status": "active"}]
+        if path.endswith("/dns_records") and method == "GET":
+            return [{"id": "rec", "content": "proj.pages.dev"}]
+        return {}
+
+    monkeypatch.setattr(cloudflare_api, "_find_zone_id", fake_find_zone_id)
+    monkeypatch.setattr(cloudflare_api, "_request", fake_request)
+
+    fqdn = cloudflare_api.ensure_custom_domain(slug="demo", project_name="proj", config=_config())
+
+    assert fqdn == "demo.example.com"
+    assert zone_lookups == ["example.com"]
+    assert ("GET", "/zones/zone-1/dns_records") in calls
+    assert not any(method in {"POST", "PUT"} for method, _ in calls)
+
+
+def test_ensure_dns_record_recovers_when_record_created_concurrently(monkeypatch: MonkeyPatch) -> None:
+    """Ensure a POST conflict re-reads the record and updates it instead of failing."""
+    calls: list[str] = []
+    dns_gets: list[int] = []
+
+    def fake_request(method: str, path: str, config: Config, **kwargs: Any) -> Any:
+        """Report no record, reject the create, then show the record Pages added."""
+        calls.append(method)
+        if method == "GET":
+            dns_gets.append(1)
+            return [] if len(dns_gets) == 1 else [{"id": "rec", "content": "other.pages.dev"}]
+        if method == "POST":
+            raise cloudflare_api.CloudflareAPIError("Record already exists", status_code=400)
+        return {}
+
+    monkeypatch.setattr(cloudflare_api, "_request", fake_request)
+
+    cloudflare_api._ensure_dns_record(
+        fqdn="demo.example.com", target="proj.pages.dev", config=_config(), zone_id="zone-1"
+    )
+
+    assert calls == ["GET", "POST", "GET", "PUT"]
+
+
+def test_list_project_domains_cached_until_post(monkeypatch: MonkeyPatch, tmp_path) -> None:
+    """Ensure domain listings persist across deploys within the TTL and are dropped after adding a domain."""
+    gets: list[str] = []
+
+    def fake_request(method: str, path: str, config: Config, **kwargs: Any) -> Any:
+        """Count domain listings and accept domain creation."""
+        if path.endswith("/domains") and method == "GET":
+            gets.append(path)
+            return []
+        if path.endswith("/domains") and method == "POST":
+            return {"name": kwargs["json"]["name"], "status": "pending"}
+        if path.endswith("/dns_records") and method == "GET":
+            return [{"id": "rec", "content": "proj.pages.dev"}]
+        return {}
+
+    monkeypatch.setattr(cloudflare_api, "_find_zone_id", lambda config: "zone-1")
+    monkeypatch.setattr(cloudflare_api, "_request", fake_request)
+
+    domains_path = "/accounts/account/pages/projects/proj/domains"
+    cache_path = tmp_path / ".landing-genie" / cloudflare_api.DOMAIN_CACHE_FILE_NAME
+    cloudflare_api._list_project_domains(domains_path, _config(), cache_path)
+    cloudflare_api._list_project_domains(domains_path, _config(), cache_path)
+    assert len(gets) == 1
+    assert "token" not in cache_path.read_text(encoding="utf-8")
+
+    other_token = dataclasses.replace(_config(), cf_api_token="other-token")
+    cloudflare_api._list_project_domains(domains_path, other_token, cache_path)
+    assert len(gets) == 2
+
+    cloudflare_api.ensure_custom_domain(slug="demo", project_name="proj", config=_config(), project_root=tmp_path)
+    assert len(gets) == 2, "a later deploy reuses the persisted listing"
+    assert cloudflare_api._read_domain_cache(cache_path, _config(), domains_path) is None
+
+    cloudflare_api._list_project_domains(domains_path, _config())
+    cloudflare_api._list_project_domains(domains_path, _config())
+    assert len(gets) == 4, "listings are only cached when a cache path is given"
+
+
+def test_ensure_custom_domain_persists_zone_id(monkeypatch: MonkeyPatch, tmp_path) -> None:
+    """Ensure a zone ID is resolved once per project root and re-resolved after a 404."""
+    zone_lookups: list[str] = []
+    stale_zones: set[str] = set()
+
+    def fake_find_zone_id(config: Config) -> str:
+        """Hand out a fresh zone ID per lookup."""
+        zone_lookups.append(config.root_domain)
+        return f"zone-{len(zone_lookups)}"
+
+    def fake_request(method: str, path: str, config: Config, **kwargs: Any) -> Any:
+        """Return canned responses, failing with 404 for zones marked stale."""
+        if path.endswith("/domains"):
+            return [{"name": "demo.example.com", "status": "active"}]
+        zone_id = path.split("/")[2]
+        if zone_id in stale_zones:
+            raise cloudflare_api.CloudflareAPIError("gone", status_code=404)
+        return [{"id": "rec", "content": "proj.pages.dev"}]
+
+    monkeypatch.setattr(cloudflare_api, "_find_zone_id", fake_find_zone_id)
+    monkeypatch.setattr(cloudflare_api, "_request", fake_request)
+
+    for _ in range(2):
+        cloudflare_api.ensure_custom_domain(
+            slug="demo", project_name="proj", config=_config(), project_root=tmp_path
+        )
+    assert zone_lookups == ["example.com"]
+
+    stale_zones.add("zone-1")
+    cloudflare_api.ensure_custom_domain(slug="demo", project_name="proj", config=_config(), project_root=tmp_path)
+    assert len(zone_lookups) == 2
+    cache_path = tmp_path / ".landing-genie" / cloudflare_api.ZONE_CACHE_FILE_NAME
+    assert cloudflare_api._read_zone_cache(cache_path, _config()) == "zone-2"
+
+    other_account = dataclasses.replace(_config(), cf_account_id="other-account")
+    assert cloudflare_api._read_zone_cache(cache_path, other_account) is None
+    other_token = dataclasses.replace(_config(), cf_api_token="other-token")
+    assert cloudflare_api._read_zone_cache(cache_path, other_token) is None
+
+
+def test_session_retries_transient_failures_except_post() -> None:
+    """Ensure the shared session retries idempotent calls on transient statuses only."""
+    adapter = cloudflare_api._SESSION.get_adapter(cloudflare_api.API_BASE)
+    retry = adapter.max_retries
+    assert retry.total == 4
+    assert {429, 503}.issubset(set(retry.status_forcelist))
+    assert "GET" in retry.allowed_methods
+    assert "POST" not in retry.allowed_methods
+
+
+def test_session_caps_retry_after_header() -> None:
+    """Ensure a long server Retry-After cannot stall a deploy past the cap."""
+    retry = cloudflare_api._SESSION.get_adapter(cloudflare_api.API_BASE).max_retries
+    response = SimpleNamespace(headers={"Retry-After": "3600"})
+    assert retry.get_retry_after(response) == RETRY_AFTER_MAX_SECONDS
+    assert retry.new(total=1).get_retry_after(response) == RETRY_AFTER_MAX_SECONDS
+    assert retry.get_retry_after(SimpleNamespace(headers={"Retry-After": "2"})) == 2
+    assert retry.get_retry_after(SimpleNamespace(headers={})) is None
+
+
+def test_project_name_sanitizes_slug_and_domain() -> None:
+    """Ensure separators become hyphens and other punctuation is dropped."""
+    assert cloudflare_api._sanitize_slug(" My_Demo/Page! ") == "my-demo-page"
+    assert cloudflare_api._sanitize_slug("!!!") == "site"
+    assert cloudflare_api._project_name("demo", "Example.co.uk") == "lp-demo-examplecouk"
+
+
+def test_run_wrangler_streams_output_and_keeps_tail(monkeypatch: MonkeyPatch) -> None:
+    """Ensure Wrangler output is logged line by line and only the tail is retained."""
+    monkeypatch.setattr(cloudflare_api, "WRANGLER_OUTPUT_TAIL_LINES", 2)
+    logged: list[str] = []
+    monkeypatch.setattr(cloudflare_api.logger, "info", lambda msg, *args: logged.append(msg % args))
+
+    script = "import sys\nfor i in range(3): print(f'line {i}')\nsys.exit(3)"
+    returncode, output = cloudflare_api._run_wrangler([sys.executable, "-c", script], env=dict(os.environ))
+
+    assert returncode == 3
+    assert logged == ["line 0", "line 1", "line 2"]
+    assert output == "line 1\nline 2"
+
+
+def test_project_name_hashes_overlong_names() -> None:
+    """Ensure long slugs sharing a prefix still get distinct names within the limit."""
+    base = "a-very-long-landing-page-slug-that-keeps-going-and-going"
+    first = cloudflare_api._project_name(f"{base}-one", "example.com")
+    second = cloudflare_api._project_name(f"{base}-two", "example.com")
+    assert first != second
+    assert len(first) <= cloudflare_api.PAGES_PROJECT_NAME_MAX_LENGTH
+    assert first.startswith("lp-a-very-long-landing-page")
+    assert first == cloudflare_api._project_name(f"{base}-one", "example.com")
+
+
+def test_resolve_pages_project_name_reuses_legacy_cut_project(monkeypatch: MonkeyPatch) -> None:
+    """Ensure a site deployed under the old cut-off name keeps deploying to that project."""
+    slug = "a-very-long-landing-page-slug-that-keeps-going-and-going-one"
+    hashed = cloudflare_api._project_name(slug, "example.com")
+    legacy = cloudflare_api._legacy_project_name(slug, "example.com")
+    assert legacy is not None and legacy != hashed
+    assert len(legacy) == cloudflare_api.PAGES_PROJECT_NAME_MAX_LENGTH
+    existing: set[str] = {legacy}
+    looked_up: list[str] = []
+
+    def fake_get_project(project_name: str, config: Config) -> Dict[str, Any] | None:
+        """Report only the projects in `existing` as present."""
+        looked_up.append(project_name)
+        return {"name": project_name} if project_name in existing else None
+
+    monkeypatch.setattr(cloudflare_api, "_get_pages_project", fake_get_project)
+
+    assert cloudflare_api._resolve_pages_project_name(slug, _config()) == legacy
+    assert looked_up == [hashed, legacy]
+
+    existing.clear()
+    assert cloudflare_api._resolve_pages_project_name(slug, _config()) == hashed
+
+    existing.update({hashed, legacy})
+    looked_up.clear()
+    assert cloudflare_api._resolve_pages_project_name(slug, _config()) == hashed
+    assert looked_up == [hashed]
+
+    looked_up.clear()
+    assert cloudflare_api._resolve_pages_project_name("demo", _config()) == "lp-demo-examplecom"
+    assert looked_up == []
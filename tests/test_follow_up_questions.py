@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Any, Optional
 
+import pytest
+
 from landing_genie.config import Config
 from landing_genie import gemini_runner
 
@@ -14,12 +16,14 @@ def _test_config() -> Config:
         root_domain="example.com",
         cf_account_id="test-account",
         cf_api_token="test-token",
+        lead_to_email=None,
         gemini_code_model="gemini-2.5-pro",
         gemini_image_model="gemini-2.5-flash-image",
         gemini_cli_command="gemini",
         gemini_api_key=None,
         gemini_telemetry_otlp_endpoint=None,
         gemini_image_cost_per_1k_tokens=None,
+        gemini_image_input_cost_per_1k_tokens=None,
     )
 
 
@@ -52,6 +56,22 @@ def test_parse_follow_up_questions_with_code_fence() -> None:
     ]
 
 
+def test_parse_combined_follow_up_questions_splits_lists() -> None:
+    """Parse text and image question lists from one fenced combined response."""
+    response_block = """```json
+{"text_questions": ["Who is the audience?"], "image_questions": ["Bright or moody lighting?"]}
+```"""
+    stdout = json.dumps({"response": response_block})
+
+    text_questions, image_questions = gemini_runner._parse_combined_follow_up_questions(stdout)
+
+    assert text_questions == ["Who is the audience?"]
+    assert image_questions == ["Bright or moody lighting?"]
+
+    with pytest.raises(ValueError):
+        gemini_runner._parse_combined_follow_up_questions(json.dumps({"response": "no lists"}))
+
+
 def test_follow_up_questions_feed_generation_prompt(tmp_path, monkeypatch) -> None:
     """Ensure follow-up answers are injected into generation prompt."""
     prompts_dir = tmp_path / "prompts"
@@ -186,3 +206,45 @@ def test_generate_site_excludes_followups_when_flag_false(tmp_path, monkeypatch)
     prompt_text = call_log[-1]["prompt"]
     assert "Follow-up clarifications" not in prompt_text
     assert "{{ follow_up_block }}" not in prompt_text
+
+
+def test_read_template_reloads_after_edit(tmp_path) -> None:
+    """Ensure cached prompt templates are re-read once the file changes."""
+    template_path = tmp_path / "prompt.md"
+    template_path.write_text("first", encoding="utf-8")
+    assert gemini_runner._read_template(template_path) == "first"
+
+    template_path.write_text("second version", encoding="utf-8")
+    assert gemini_runner._read_template(template_path) == "second version"
+
+
+def test_render_template_substitutes_in_one_pass() -> None:
+    """Ensure placeholders are filled once and substituted text is not re-expanded."""
+    rendered = gemini_runner._render_template(
+        "{{ slug }} / {{ feedback }} / {{ unknown }}",
+        {"slug": "demo", "feedback": "mention {{ slug }} literally"},
+    )
+    assert rendered == "demo / mention {{ slug }} literally / {{ unknown }}"
+
+
+def test_generate_sites_runs_each_slug(tmp_path, monkeypatch) -> None:
+    """Ensure batch generation renders one prompt per slug and keeps input order."""
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir(parents=True, exist_ok=True)
+    (prompts_dir / "runtime_generation_prompt.md").write_text("{{ slug }}: {{ product_prompt }}", encoding="utf-8")
+
+    prompts: list[str] = []
+
+    def fake_run_gemini(prompt_text: str, *args: Any, **kwargs: Any) -> None:
+        """Capture generation prompts."""
+        prompts.append(prompt_text)
+
+    monkeypatch.setattr(gemini_runner, "_run_gemini", fake_run_gemini)
+
+    slugs = gemini_runner.generate_sites(
+        [("alpha", "First"), ("beta", "Second"), ("gamma", "Third")], tmp_path, _test_config(), max_workers=2
+    )
+
+    assert slugs == ["alpha", "beta", "gamma"]
+    assert sorted(prompts) == ["alpha: First", "beta: Second", "gamma: Third"]
+    assert all((tmp_path / "sites" / slug).is_dir() for slug in slugs)
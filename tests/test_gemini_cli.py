@@ -4,11 +4,31 @@ import json
 import os
 import shutil
 import subprocess
+from dataclasses import replace
+from types import SimpleNamespace
 
 import pytest
 
 from landing_genie.config import Config
-from landing_genie.gemini_runner import _iter_json_objects
+from landing_genie import gemini_runner
+from landing_genie.gemini_runner import _enforce_log_cap, _extract_usage, _gemini_cli_env, _iter_json_objects
+
+
+def _test_config() -> Config:
+    """Build a minimal Config for Gemini CLI tests."""
+    return Config(
+        root_domain="example.com",
+        cf_account_id="acc",
+        cf_api_token="token",
+        lead_to_email=None,
+        gemini_code_model="gemini-2.5-pro",
+        gemini_image_model="gemini-2.5-flash-image",
+        gemini_cli_command="gemini",
+        gemini_api_key=None,
+        gemini_telemetry_otlp_endpoint=None,
+        gemini_image_cost_per_1k_tokens=None,
+        gemini_image_input_cost_per_1k_tokens=None,
+    )
 
 
 def test_gemini_cli_smoke() -> None:
@@ -58,3 +78,93 @@ def test_gemini_cli_smoke() -> None:
     assert any("candidates" in obj or "usageMetadata" in obj or "stats" in obj for obj in objs), (
         f"Gemini CLI JSON missing expected fields: {objs[0]}"
     )
+
+
+def test_extract_usage_reads_json_and_text_fallbacks() -> None:
+    """Ensure token counts come from usageMetadata JSON or the regex fallback for inspected dicts."""
+    json_stdout = 'noise\n{"response": "ok", "usageMetadata": {"promptTokenCount": 3, "candidatesTokenCount": 4, "totalTokenCount": 7}}'
+    assert _extract_usage(json_stdout, "model") == (3, 4, 7)
+
+    inspected = "{'usageMetadata': {'promptTokenCount': 5, 'candidatesTokenCount': 6, 'totalTokenCount': 11}}"
+    assert _extract_usage(inspected, "model") == (5, 6, 11)
+
+    assert _extract_usage("no telemetry here", "model") == (None, None, None)
+
+
+def test_extract_usage_keeps_zero_counts_from_telemetry() -> None:
+    """Ensure a zero token count from OTLP-style attributes is not replaced by a text match."""
+    stdout = (
+        '{"attributes": {"gen_ai.usage.input_tokens": 9, "gen_ai.usage.output_tokens": 0}}\n'
+        "output_tokens: 42"
+    )
+    assert _extract_usage(stdout, "model") == (9, 0, 9)
+
+
+def test_gemini_cli_env_only_copies_when_needed(monkeypatch) -> None:
+    """Ensure the CLI inherits the environment unless a variable must change."""
+    config = replace(_test_config(), gemini_api_key="secret")
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.delenv("GEMINI_ALLOW_CLI_API_KEY", raising=False)
+    assert _gemini_cli_env(config) is None
+
+    monkeypatch.setenv("GEMINI_API_KEY", "secret")
+    env = _gemini_cli_env(config)
+    assert env is not None and "GEMINI_API_KEY" not in env
+    assert os.environ["GEMINI_API_KEY"] == "secret"
+
+
+def test_extract_usage_stats_fallback_gap_is_bounded() -> None:
+    """Ensure the stats fallbacks only pair "tokens" with a count at most 512 characters later."""
+    within = "tokens" + " " * 512 + "total: 7"
+    beyond = "tokens" + " " * 513 + "total: 7"
+
+    assert gemini_runner._STATS_TOTAL_RE.search(within) is not None
+    assert gemini_runner._STATS_TOTAL_RE.search(beyond) is None
+    assert gemini_runner._STATS_PROMPT_RE.search("tokens" + " " * 513 + "prompt: 3") is None
+    assert gemini_runner._STATS_COMPLETION_RE.search("tokens" + " " * 513 + "output: 4") is None
+    assert _extract_usage(within, "model") == (None, None, 7)
+    assert _extract_usage(beyond, "model") == (None, None, None)
+
+
+def test_enforce_log_cap_keeps_tail(tmp_path) -> None:
+    """Ensure the prompt log is trimmed to its newest bytes without leaving a temp file."""
+    log_path = tmp_path / "gemini_prompts.log"
+    log_path.write_bytes(b"a" * 500 + b"b" * 100)
+    _enforce_log_cap(log_path, 112)
+
+    data = log_path.read_bytes()
+    assert data == b"[truncated]\n" + b"b" * 100
+    assert [p.name for p in tmp_path.iterdir()] == ["gemini_prompts.log"]
+
+
+def test_run_gemini_sends_oversized_prompt_on_stdin(monkeypatch) -> None:
+    """Ensure prompts too large for one argv string are piped to the CLI instead."""
+    config = _test_config()
+    calls: list[tuple[list[str], object]] = []
+
+    def _fake_run(cmd: list[str], **kwargs: object) -> SimpleNamespace:
+        """Record the argv and stdin of each CLI call."""
+        calls.append((cmd, kwargs.get("input")))
+        return SimpleNamespace(returncode=0, stdout="{}", stderr="")
+
+    monkeypatch.setenv("LANDING_GENIE_PROMPT_LOG_PATH", "")
+    monkeypatch.setattr(gemini_runner.subprocess, "run", _fake_run)
+    big_prompt = "x" * gemini_runner.GEMINI_ARGV_PROMPT_MAX_BYTES
+    gemini_runner._run_gemini("small", "model", config)
+    gemini_runner._run_gemini(big_prompt, "model", config)
+
+    assert calls[0] == (["gemini", "--model", "model", "--yolo", "--output-format", "json", "small"], None)
+    assert big_prompt not in calls[1][0]
+    assert calls[1][1] == big_prompt
+
+
+def test_parse_prompt_snippets_returns_read_only_mapping() -> None:
+    """Ensure cached snippets cannot be mutated by one caller and leak into the next."""
+    content = "## follow_up_block\nFollow-ups:\n{{ follow_up_context }}\n"
+    snippets = gemini_runner._parse_prompt_snippets(content)
+
+    assert snippets["follow_up_block"] == "Follow-ups:\n{{ follow_up_context }}\n"
+    with pytest.raises(TypeError):
+        snippets["follow_up_block"] = "tampered"  # type: ignore[index]
+    assert gemini_runner._parse_prompt_snippets(content)["follow_up_block"] == "Follow-ups:\n{{ follow_up_context }}\n"
+    assert dict(gemini_runner._parse_prompt_snippets("no headers")) == {}
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any, Optional
 
-from landing_genie import gemini_runner
+from landing_genie import gemini_runner, image_generator
 from landing_genie.config import Config
 
 
@@ -13,12 +13,14 @@ def _test_config() -> Config:
         root_domain="example.com",
         cf_account_id="test-account",
         cf_api_token="test-token",
+        lead_to_email=None,
         gemini_code_model="gemini-2.5-pro",
         gemini_image_model="gemini-2.5-flash-image",
         gemini_cli_command="gemini",
         gemini_api_key=None,
         gemini_telemetry_otlp_endpoint=None,
         gemini_image_cost_per_1k_tokens=None,
+        gemini_image_input_cost_per_1k_tokens=None,
     )
 
 
@@ -105,3 +107,33 @@ def test_generate_image_prompt_uses_template(tmp_path, monkeypatch) -> None:
     assert "Hero banner showing the product" in sent_prompt
     assert "AI tutor" in sent_prompt
     assert "Prefer bright colors" in sent_prompt
+
+
+def test_generate_image_prompts_for_site_fills_missing_slots(tmp_path, monkeypatch) -> None:
+    """Ensure slots missed by the batch call are resolved individually, in page order."""
+    site_dir = tmp_path / "sites" / "demo"
+    site_dir.mkdir(parents=True)
+    (site_dir / "index.html").write_text(
+        '<img src="assets/a.png" alt="A"><img src="assets/b.png" alt="B"><img src="assets/c.png" alt="C">',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(
+        gemini_runner, "generate_image_prompts_batch", lambda *args, **kwargs: {"assets/b.png": "batch b"}
+    )
+    resolved: list[str] = []
+
+    def fake_resolve(slot, *args, **kwargs) -> str:
+        """Return a per-slot prompt."""
+        resolved.append(slot.src)
+        return f"single {slot.src}"
+
+    monkeypatch.setattr(image_generator, "_resolve_image_prompt_for_slot", fake_resolve)
+
+    prompts = image_generator.generate_image_prompts_for_site("demo", "Product", tmp_path, _test_config())
+
+    assert sorted(resolved) == ["assets/a.png", "assets/c.png"]
+    assert prompts == [
+        ("assets/a.png", "single assets/a.png"),
+        ("assets/b.png", "batch b"),
+        ("assets/c.png", "single assets/c.png"),
+    ]
@@ -15,12 +15,14 @@ def _dummy_config() -> Config:
         root_domain="example.com",
         cf_account_id="acc",
         cf_api_token="token",
+        lead_to_email=None,
         gemini_code_model="gemini-2.5-pro",
         gemini_image_model="gemini-2.5-flash-image",
         gemini_cli_command="gemini",
         gemini_api_key=None,
         gemini_telemetry_otlp_endpoint=None,
         gemini_image_cost_per_1k_tokens=None,
+        gemini_image_input_cost_per_1k_tokens=None,
     )
 
 
@@ -87,3 +89,31 @@ def test_refine_endpoint_invokes_refine_site(monkeypatch, tmp_path) -> None:
     assert "make it better" in str(calls["feedback"])
     assert ("demo", tmp_path) in placeholder_calls
     assert isinstance(calls["config"], Config)
+
+
+def test_preview_version_bumps_only_after_refinement(tmp_path) -> None:
+    """Ensure tabs see a new version only when a refinement is reported, and polling marks them open."""
+    site_dir = tmp_path / "sites" / "demo"
+    site_dir.mkdir(parents=True)
+    (site_dir / "index.html").write_text("<html><body></body></html>")
+
+    url = preview.serve_local("demo", tmp_path, config=_dummy_config(), port=0, debug=False)
+    port = urlparse(url).port
+    assert port is not None
+
+    def _poll() -> int:
+        """Fetch the live-reload version the overlay polls."""
+        with request.urlopen(f"http://localhost:{port}/__preview/version", timeout=5) as resp:
+            return json.loads(resp.read().decode("utf-8"))["version"]
+
+    try:
+        assert preview.reload_previews("demo", tmp_path) is False
+        first = _poll()
+        (site_dir / "assets.css").write_text("body {}")
+        assert _poll() == first, "file writes alone must not trigger a reload mid-refine"
+
+        assert preview.reload_previews("demo", tmp_path) is True
+        assert _poll() == first + 1
+        assert preview.reload_previews("other", tmp_path) is False
+    finally:
+        preview._stop_server(port)
@@ -1,14 +1,19 @@
 """Tests for product slot selection and image references."""
 
+import base64
 import json
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Optional, TypeGuard, cast
 
 import pytest
 
-from landing_genie import gemini_runner
+from landing_genie import gemini_runner, image_generator
 from landing_genie.config import Config
+from landing_genie.http_utils import RETRY_AFTER_MAX_SECONDS
 from landing_genie.image_generator import generate_images_for_site
 
 
@@ -18,6 +23,7 @@ def _test_config() -> Config:
         root_domain="example.com",
         cf_account_id="test-account",
         cf_api_token="test-token",
+        lead_to_email=None,
         gemini_code_model="gemini-2.5-pro",
         gemini_image_model="gemini-2.5-flash-image",
         gemini_cli_command="gemini",
@@ -121,6 +127,8 @@ def test_product_slots_empty_selection_generates_freely(
         *,
         reference_image: bytes | None = None,
         reference_mime_type: str | None = None,
+        reference_cache_path: Path | None = None,
+        reference_file_uri: str | None = None,
     ) -> tuple[bytes, None]:
         """Stub image generation while recording references."""
         request_log.append({"prompt": prompt, "reference": reference_image})
@@ -172,6 +180,12 @@ def test_product_slots_valid_selection_uses_reference(
 
     describe_calls: list[bytes] = []
     request_log: list[dict[str, Any]] = []
+    uploads: list[bytes] = []
+
+    def fake_upload(data: bytes, mime_type: str, api_key: str) -> str:
+        """Record reference uploads."""
+        uploads.append(data)
+        return "https://files.example/canonical"
 
     def fake_describe(*args: Any, **kwargs: Any) -> str:
         """Stub description for canonical product."""
@@ -185,13 +199,16 @@ def test_product_slots_valid_selection_uses_reference(
         *,
         reference_image: bytes | None = None,
         reference_mime_type: str | None = None,
+        reference_cache_path: Path | None = None,
+        reference_file_uri: str | None = None,
     ) -> tuple[bytes, None]:
         """Stub image generation while recording references."""
-        request_log.append({"prompt": prompt, "reference": reference_image})
+        request_log.append({"prompt": prompt, "reference": reference_image, "file_uri": reference_file_uri})
         return b"img", None
 
     monkeypatch.setattr("landing_genie.image_generator._describe_canonical_product", fake_describe)
     monkeypatch.setattr("landing_genie.image_generator._request_image", fake_request_image)
+    monkeypatch.setattr(image_generator, "_upload_gemini_file", fake_upload)
 
     generated = generate_images_for_site(
         slug=slug,
@@ -209,12 +226,161 @@ def test_product_slots_valid_selection_uses_reference(
     assert len(with_reference) == 1
     assert "assets/feature.png" in with_reference[0]["prompt"]
     assert "Canonical product description: desc" in with_reference[0]["prompt"]
+    assert with_reference[0]["file_uri"] == "https://files.example/canonical"
+    assert uploads == [b"img"]
 
     without_reference = [entry for entry in request_log if entry["reference"] is None]
     assert len(without_reference) == 2
     assert all("Canonical product description" not in entry["prompt"] for entry in without_reference)
 
 
+def test_reference_file_uri_reuses_cached_upload(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure identical reference bytes are uploaded to the Files API only once."""
+    uploads: list[bytes] = []
+
+    def fake_upload(data: bytes, mime_type: str, api_key: str) -> str:
+        """Record uploads and return a fake file URI."""
+        uploads.append(data)
+        return f"https://files.example/{len(uploads)}"
+
+    monkeypatch.setattr(image_generator, "_upload_gemini_file", fake_upload)
+    cache_path = tmp_path / ".landing-genie" / "gemini-files.json"
+
+    first = image_generator._reference_file_uri(b"ref", "image/png", "key", cache_path)
+    second = image_generator._reference_file_uri(b"ref", "image/png", "key", cache_path)
+    other = image_generator._reference_file_uri(b"other", "image/png", "key", cache_path)
+
+    assert first == second == "https://files.example/1"
+    assert other == "https://files.example/2"
+    assert uploads == [b"ref", b"other"]
+
+
+def test_reference_file_uri_uploads_once_under_concurrency(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure concurrent callers with the same reference share a single upload."""
+    uploads: list[bytes] = []
+
+    def fake_upload(data: bytes, mime_type: str, api_key: str) -> str:
+        """Record uploads slowly enough for callers to overlap."""
+        uploads.append(data)
+        time.sleep(0.05)
+        return f"https://files.example/{len(uploads)}"
+
+    monkeypatch.setattr(image_generator, "_upload_gemini_file", fake_upload)
+    cache_path = tmp_path / ".landing-genie" / "gemini-files.json"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        uris = list(
+            executor.map(
+                lambda _i: image_generator._reference_file_uri(b"ref", "image/png", "key", cache_path),
+                range(4),
+            )
+        )
+
+    assert uris == ["https://files.example/1"] * 4
+    assert uploads == [b"ref"]
+    assert [p.name for p in cache_path.parent.iterdir()] == ["gemini-files.json"]
+
+
+def test_reference_file_uri_is_scoped_to_api_key(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure an upload cached under one API key is not reused for another."""
+    uploads: list[str] = []
+
+    def fake_upload(data: bytes, mime_type: str, api_key: str) -> str:
+        """Record the uploading key and return a fake file URI."""
+        uploads.append(api_key)
+        return f"https://files.example/{api_key}"
+
+    monkeypatch.setattr(image_generator, "_upload_gemini_file", fake_upload)
+    cache_path = tmp_path / ".landing-genie" / "gemini-files.json"
+
+    first = image_generator._reference_file_uri(b"ref", "image/png", "key-a", cache_path)
+    second = image_generator._reference_file_uri(b"ref", "image/png", "key-b", cache_path)
+
+    assert first == "https://files.example/key-a"
+    assert second == "https://files.example/key-b"
+    assert uploads == ["key-a", "key-b"]
+
+
+def test_request_image_retries_inline_when_file_uri_rejected(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure a rejected cached file URI is dropped and the reference is resent inline."""
+    cache_path = tmp_path / ".landing-genie" / "gemini-files.json"
+    monkeypatch.setattr(image_generator, "_upload_gemini_file", lambda *_args: "https://files.example/stale")
+    sent_parts: list[dict[str, Any]] = []
+    image_b64 = base64.b64encode(b"img").decode("ascii")
+
+    def fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+        """Reject fileData references and accept inline ones."""
+        part = cast(dict[str, Any], kwargs["json"])["contents"][0]["parts"][0]
+        sent_parts.append(part)
+        if "fileData" in part:
+            return SimpleNamespace(status_code=400, text="file not found", json=lambda: {})
+        body = {"candidates": [{"content": {"parts": [{"inlineData": {"data": image_b64}}]}}]}
+        return SimpleNamespace(status_code=200, text="", json=lambda: body)
+
+    monkeypatch.setattr(image_generator._SESSION, "post", fake_post)
+    image_bytes, _usage = image_generator._request_image(
+        "prompt",
+        "model",
+        "key",
+        reference_image=b"ref",
+        reference_cache_path=cache_path,
+    )
+
+    assert image_bytes == b"img"
+    assert ["fileData" in part for part in sent_parts] == [True, False]
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == {}
+
+
+def test_request_image_surfaces_non_file_errors_without_retrying(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure a 4xx that does not blame the file reference is raised after one call."""
+    cache_path = tmp_path / ".landing-genie" / "gemini-files.json"
+    monkeypatch.setattr(image_generator, "_upload_gemini_file", lambda *_args: "https://files.example/ok")
+    posts: list[str] = []
+
+    def fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+        """Reject the prompt on safety grounds."""
+        posts.append(url)
+        return SimpleNamespace(status_code=400, text="Request blocked by safety settings", json=lambda: {})
+
+    monkeypatch.setattr(image_generator._SESSION, "post", fake_post)
+    with pytest.raises(RuntimeError, match="400"):
+        image_generator._request_image(
+            "prompt",
+            "model",
+            "key",
+            reference_image=b"ref",
+            reference_cache_path=cache_path,
+        )
+
+    assert len(posts) == 1
+    assert image_generator._reference_file_uri(b"ref", "image/png", "key", cache_path) == "https://files.example/ok"
+
+
+def test_image_session_only_retries_unprocessed_posts() -> None:
+    """Ensure image POSTs retry connection failures and refusals but never read timeouts."""
+    adapter = image_generator._SESSION.get_adapter(image_generator._API_URL)
+    retry = adapter.max_retries
+    assert "POST" in retry.allowed_methods
+    assert retry.read == 0
+    assert set(retry.status_forcelist) == {429, 503}
+    assert retry.get_retry_after(SimpleNamespace(headers={"Retry-After": "600"})) == RETRY_AFTER_MAX_SECONDS
+
+
 def test_select_product_slots_invalid_json_returns_empty(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,